@@ -144,7 +144,9 @@ async def websocket_endpoint(
                             from_sequence
                         )
                         
-                        # Send replay complete message
+                        # Send replay complete message through the same
+                        # per-connection queue as the replayed frames, so the
+                        # confirmation cannot overtake the backlog it announces
                         replay_msg = WebSocketMessage(
                             message_id=str(uuid.uuid4()),
                             operation_id=operation_id,
@@ -157,7 +159,7 @@ async def websocket_endpoint(
                             is_final=False,
                             collapsible=False
                         )
-                        await websocket.send_json(replay_msg.model_dump(mode="json"))
+                        await connection_manager.send_message(connection_id, replay_msg)
                 
                 elif message_type == "acknowledge":
                     # Update acknowledged sequence
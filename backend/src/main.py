@@ -17,6 +17,7 @@ import os
 import logging
 
 from src.api import auth, websocket, repositories, documents, system
+from src.services.github_client import GitHubClient
 from src.utils.error_handlers import register_exception_handlers
 from src.utils.logging import setup_logging
 
@@ -34,13 +35,17 @@ app = FastAPI(
     openapi_url="/openapi.json"
 )
 
-def _get_allowed_origins() -> list[str]:
-    """Resolve CORS origins from environment with safe localhost defaults."""
+def _get_allowed_origins() -> frozenset[str]:
+    """Resolve CORS origins from environment with safe localhost defaults.
+
+    Returns a frozenset so the middleware's per-request origin membership
+    check is O(1) instead of a list scan.
+    """
     cors_origins = os.getenv("CORS_ORIGINS", "").strip()
     if cors_origins:
-        return [origin.strip() for origin in cors_origins.split(",") if origin.strip()]
+        return frozenset(origin.strip() for origin in cors_origins.split(",") if origin.strip())
 
-    return [
+    return frozenset({
         "http://localhost:3000",
         "http://localhost:3001",
         "http://localhost:3300",
@@ -51,7 +56,7 @@ def _get_allowed_origins() -> list[str]:
         "http://localhost:8800",
         "http://127.0.0.1:8000",
         "http://127.0.0.1:8800",
-    ]
+    })
 
 
 ALLOWED_ORIGINS = _get_allowed_origins()
@@ -107,7 +112,8 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Backend application shutting down...")
-    # TODO: Cleanup connections
+    # Close the aiohttp session/connection pool shared by all GitHub clients
+    await GitHubClient.shutdown()
 
 if __name__ == "__main__":
     import uvicorn
@@ -120,5 +126,9 @@ if __name__ == "__main__":
         host=host,
         port=port,
         reload=debug,
-        log_level="info"
+        log_level="info",
+        # Broadcasts enqueue one shared bytes payload for all subscribers;
+        # permessage-deflate would re-compress that payload per connection
+        # and keep a compression context per socket, so leave it off
+        ws_per_message_deflate=False
     )
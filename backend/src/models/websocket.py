@@ -7,6 +7,7 @@ Models:
 - MessageType: Types of messages (thinking, execution, error, complete)
 """
 
+import time
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
@@ -52,6 +53,7 @@ class WebSocketMessage(BaseModel):
     
     # Metadata
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Message creation time")
+    timestamp_ts: float = Field(default_factory=time.time, description="Creation time as epoch seconds (cheap retention comparisons)")
     priority: MessagePriority = Field(default=MessagePriority.NORMAL, description="Message priority")
     
     # Message attributes
@@ -168,7 +168,12 @@ class AuthService:
         
         # Get token scopes (basic check)
         client = GitHubClient(token)
-        scopes = client.get_token_scopes()
+        try:
+            scopes = await client.get_token_scopes()
+        except GitHubAPIError as e:
+            # Scopes are informational; don't fail session creation
+            logger.warning(f"Could not determine token scopes: {e}")
+            scopes = []
         await client.close()
         
         # Create token model
@@ -9,16 +9,24 @@ Provides methods for:
 """
 
 import asyncio
+import base64
+import hashlib
 import logging
-import uuid
-from typing import List, Optional, Dict, Any, Tuple
+import re
+import time
+from typing import List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime, timedelta
 
 import aiohttp
+import orjson
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 from github import Github, GithubException, RateLimitExceededException
-from github.Repository import Repository as GithubRepository
-from github.Branch import Branch as GithubBranch
-from github.ContentFile import ContentFile
+from pydantic import TypeAdapter
 
 from src.models.github import Repository, Branch, Commit, Feature, FeatureStatus
 from src.models.auth import User, TokenScope
@@ -26,6 +34,58 @@ from src.services.storage import storage
 
 logger = logging.getLogger(__name__)
 
+# Base URL for the GitHub REST v3 API
+GITHUB_API_BASE = "https://api.github.com"
+
+# Sentinel cached in place of file content when GitHub returned a 404,
+# so repeated polls for a missing file don't each pay a round-trip.
+_FILE_MISSING = object()
+
+# Bound concurrent PyGithub worker threads so its internal connection
+# pool isn't exhausted under fan-out load (shared across all clients).
+_GITHUB_THREAD_SEMAPHORE = asyncio.Semaphore(10)
+
+# Strong references to fire-and-forget prefetch tasks: the event loop
+# only keeps weak references, so an unreferenced task can be
+# garbage-collected mid-flight.
+_BACKGROUND_TASKS: Set["asyncio.Task"] = set()
+
+# List payloads are cached as JSON bytes (pydantic v2's Rust codec
+# encodes/decodes in one pass) so cached data never aliases live model
+# objects that a caller might mutate.
+_REPO_LIST_ADAPTER = TypeAdapter(List[Repository])
+_BRANCH_LIST_ADAPTER = TypeAdapter(List[Branch])
+
+# Branch names worth scanning for specs during feature discovery
+# (feature/*, feat/*, spec/* or numeric-prefixed like 001-feature).
+_FEATURE_BRANCH_RE = re.compile(r"^(feature/|feat/|spec/|\d+[^/]*-)")
+
+# One round-trip for all branches with commit SHA and protection state,
+# instead of paged REST plus per-branch lazy fetches.
+_BRANCHES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/heads/", first: 100, after: $cursor) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        name
+        target { oid }
+        branchProtectionRule { id }
+      }
+    }
+  }
+}
+"""
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry rate limits, GitHub 5xx responses and transport errors."""
+    if isinstance(exc, RateLimitExceededException):
+        return True
+    if isinstance(exc, GithubException):
+        return exc.status >= 500
+    return isinstance(exc, aiohttp.ClientError)
+
 
 class GitHubAPIError(Exception):
     """Base exception for GitHub API errors."""
@@ -57,86 +117,309 @@ class GitHubClient:
     CACHE_TTL_REPOSITORIES = 300  # 5 minutes
     CACHE_TTL_BRANCHES = 60  # 1 minute
     CACHE_TTL_FILES = 30  # 30 seconds
+    CACHE_TTL_RATE_LIMIT = 10  # seconds (polled by dashboards)
+    CACHE_TTL_SCOPES = 300  # 5 minutes (scopes only change on re-auth)
     
     # Rate limit retry settings
     MAX_RETRIES = 3
     INITIAL_RETRY_DELAY = 1  # seconds
     MAX_RETRY_DELAY = 60  # seconds
-    
+
+    # How long to remember that a file was missing (404 tombstone)
+    CACHE_TTL_MISSING_FILES = 5  # seconds
+
+    # How long stale payloads are retained after their freshness TTL
+    # lapses, so they can be revalidated with If-None-Match (a 304
+    # response is empty and does not consume rate-limit quota)
+    CACHE_TTL_ETAG_RETENTION = 3600  # 1 hour
+
+    # One aiohttp session (and connection pool) shared by every client
+    # instance; auth is injected per-request, not per-session. The session
+    # and the lock guarding its creation are bound to the event loop that
+    # created them, so _get_session tracks the owning loop and rebuilds
+    # both when a different loop calls in.
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _session_loop: Optional[asyncio.AbstractEventLoop] = None
+    _session_lock: Optional[asyncio.Lock] = None
+
     def __init__(self, token: str):
         """
         Initialize GitHub client with personal access token.
-        
+
         Args:
             token: GitHub personal access token
         """
         self.token = token
+        # Cache-key component for per-token entries (never the raw token)
+        self._token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
         self._github = Github(token)
-        self._session: Optional[aiohttp.ClientSession] = None
-    
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session for async operations."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers={
-                    "Authorization": f"Bearer {self.token}",
-                    "Accept": "application/vnd.github.v3+json"
-                }
-            )
-        return self._session
-    
+        # Pages already scheduled for speculative prefetch (guards against
+        # re-spawning tasks and prefetch recursion)
+        self._prefetched: Set[str] = set()
+        # Last-known rate limit snapshot (see get_rate_limit_status)
+        self._rl_snapshot: Dict[str, Any] = {}
+        self._rl_snapshot_at: float = 0.0
+        # In-flight fetches keyed by cache key (see _single_flight)
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        """Get or lazily create the shared aiohttp session.
+
+        One session per process keeps a single connection pool to
+        api.github.com (TLS handshakes and DNS lookups are amortized
+        across all users) instead of one pool per token.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._session_loop is not loop:
+            # The previous owning loop is gone (serial asyncio.run()
+            # callers, test runs, worker restarts). Reusing its session
+            # raises "Event loop is closed" on every request, so drop it
+            # and start fresh on this loop; the old connector's sockets
+            # died with their loop, so there is nothing left to close.
+            cls._shared_session = None
+            cls._session_lock = asyncio.Lock()
+            cls._session_loop = loop
+        if cls._shared_session is None or cls._shared_session.closed:
+            async with cls._session_lock:
+                if cls._shared_session is None or cls._shared_session.closed:
+                    cls._shared_session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(
+                            limit=500,
+                            limit_per_host=100,
+                            ttl_dns_cache=300,
+                            # GitHub closes idle keep-alive connections
+                            # after ~90s; recycle ours just before that
+                            keepalive_timeout=75
+                        ),
+                        headers={"Accept": "application/vnd.github.v3+json"},
+                        # orjson is ~3-5x faster than stdlib json on large
+                        # GitHub list responses (e.g. /user/repos pages)
+                        json_serialize=lambda obj: orjson.dumps(obj).decode()
+                    )
+        return cls._shared_session
+
+    def _auth_headers(self) -> Dict[str, str]:
+        """Per-request authorization headers for the shared session."""
+        return {"Authorization": f"Bearer {self.token}"}
+
+    async def _single_flight(self, cache_key: str, fetch) -> Any:
+        """
+        Coalesce concurrent fetches of the same cache key.
+
+        When several requests miss the cache on the same key at once
+        (typical right after a TTL expiry under load), only the first
+        runs fetch(); the rest await its result instead of each issuing
+        their own GitHub round-trip.
+        """
+        fut = self._inflight.get(cache_key)
+        if fut is not None:
+            return await fut
+
+        fut = asyncio.ensure_future(fetch())
+        self._inflight[cache_key] = fut
+        try:
+            return await fut
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    @staticmethod
+    async def _parse_json(resp: aiohttp.ClientResponse) -> Any:
+        """Parse a JSON response body with orjson (hot path for list endpoints)."""
+        return await resp.json(loads=orjson.loads)
+
+    async def _rest(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        return_headers: bool = False
+    ) -> Any:
+        """
+        Issue a REST request against the GitHub v3 API on the shared session.
+
+        Args:
+            method: HTTP method
+            path: API path (e.g. "/user/repos")
+            params: Query parameters
+            json_body: JSON request body
+            headers: Extra request headers (e.g. If-None-Match for
+                conditional requests; a 304 yields a None body)
+            return_headers: Also return the response headers (for ETag
+                capture on cacheable GETs)
+
+        Returns:
+            Parsed JSON body (None for empty/304 responses), or a
+            (body, response_headers) tuple when return_headers is True
+
+        Raises:
+            GithubException: On error statuses, so the retry/translation
+                layer treats native calls exactly like PyGithub ones
+        """
+        session = await self._get_session()
+        req_headers = self._auth_headers()
+        if headers:
+            req_headers.update(headers)
+
+        async with session.request(
+            method,
+            f"{GITHUB_API_BASE}{path}",
+            params=params,
+            json=json_body,
+            headers=req_headers
+        ) as resp:
+            if resp.status >= 400:
+                try:
+                    data = await self._parse_json(resp)
+                except Exception:
+                    data = {"message": await resp.text()}
+                resp_headers = dict(resp.headers)
+
+                if resp.status == 429 or (
+                    resp.status == 403 and resp.headers.get("X-RateLimit-Remaining") == "0"
+                ):
+                    raise RateLimitExceededException(resp.status, data, resp_headers)
+                raise GithubException(resp.status, data, resp_headers)
+
+            if resp.status in (204, 304):
+                data = None
+            else:
+                data = await self._parse_json(resp)
+
+            if return_headers:
+                return data, dict(resp.headers)
+            return data
+
+    async def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a GraphQL query against the GitHub v4 API.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            The "data" portion of the response
+
+        Raises:
+            GitHubAPIError: On HTTP or GraphQL-level errors
+        """
+        session = await self._get_session()
+        async with session.post(
+            "https://api.github.com/graphql",
+            json={"query": query, "variables": variables},
+            headers=self._auth_headers()
+        ) as resp:
+            if resp.status == 401:
+                raise GitHubAuthenticationError("Invalid GitHub token")
+            if resp.status != 200:
+                raise GitHubAPIError(f"GitHub GraphQL error: HTTP {resp.status}")
+            body = await self._parse_json(resp)
+
+        if body.get("errors"):
+            raise GitHubAPIError(f"GitHub GraphQL error: {body['errors']}")
+
+        return body["data"]
+
     async def close(self):
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """No-op kept for API compatibility.
+
+        The HTTP session is shared across all clients; use
+        GitHubClient.shutdown() at application teardown instead.
+        """
+        return
+
+    @classmethod
+    async def shutdown(cls):
+        """Close the shared HTTP session (call once at app shutdown)."""
+        if cls._shared_session and not cls._shared_session.closed:
+            await cls._shared_session.close()
+        cls._shared_session = None
+        cls._session_loop = None
+        cls._session_lock = None
     
+    def _retry_wait(self, retry_state) -> float:
+        """
+        Compute the delay before the next retry attempt.
+
+        Decorrelated-jitter exponential backoff (so concurrent clients
+        don't retry in lockstep after an incident), stretched to the rate
+        limit reset or Retry-After when GitHub told us when to come back.
+        """
+        wait = wait_random_exponential(
+            multiplier=self.INITIAL_RETRY_DELAY, max=self.MAX_RETRY_DELAY
+        )(retry_state)
+
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(exc, GithubException):
+            headers = exc.headers or {}
+            # Secondary rate limits (abuse detection) answer with an
+            # explicit Retry-After; retrying sooner just extends the ban
+            retry_after = headers.get("retry-after") or headers.get("Retry-After")
+            if retry_after:
+                wait = max(wait, min(float(retry_after), self.MAX_RETRY_DELAY))
+
+            if isinstance(exc, RateLimitExceededException):
+                reset = headers.get("x-ratelimit-reset") or headers.get("X-RateLimit-Reset")
+                if reset:
+                    until_reset = float(reset) - time.time()
+                    wait = max(wait, min(until_reset, self.MAX_RETRY_DELAY))
+
+        return wait
+
     async def _retry_with_backoff(self, func, *args, **kwargs):
         """
-        Execute function with exponential backoff retry logic.
-        
-        Handles rate limiting (429) and transient errors (5xx).
+        Execute function with jittered exponential backoff retry logic
+        (via tenacity).
+
+        Handles rate limiting (429) and transient errors (5xx). The rate
+        limit reset time is read from the exception headers rather than a
+        re-entrant get_rate_limit() call, which would itself consume quota
+        while rate limited.
+
+        Sync functions (blocking PyGithub calls) are run in a worker thread
+        via asyncio.to_thread so the event loop keeps servicing other
+        coroutines during each GitHub round-trip.
         """
-        delay = self.INITIAL_RETRY_DELAY
-        
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                return await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
-            
-            except RateLimitExceededException as e:
-                # GitHub rate limit exceeded
-                if attempt == self.MAX_RETRIES - 1:
-                    logger.error(f"Rate limit exceeded after {self.MAX_RETRIES} retries")
-                    raise GitHubRateLimitError(f"GitHub rate limit exceeded: {str(e)}")
-                
-                # Get reset time from rate limit
-                rate_limit = self._github.get_rate_limit()
-                reset_time = rate_limit.core.reset
-                wait_seconds = (reset_time - datetime.utcnow()).total_seconds()
-                
-                # Wait until rate limit resets (or max delay)
-                wait_seconds = min(wait_seconds, self.MAX_RETRY_DELAY)
-                logger.warning(f"Rate limit exceeded, waiting {wait_seconds}s until reset")
-                await asyncio.sleep(wait_seconds)
-            
-            except GithubException as e:
-                # Handle 5xx errors with exponential backoff
-                if e.status >= 500:
-                    if attempt == self.MAX_RETRIES - 1:
-                        logger.error(f"GitHub API error after {self.MAX_RETRIES} retries: {e}")
-                        raise GitHubAPIError(f"GitHub API error: {str(e)}")
-                    
-                    logger.warning(f"GitHub API error (attempt {attempt + 1}), retrying in {delay}s: {e}")
-                    await asyncio.sleep(delay)
-                    delay = min(delay * 2, self.MAX_RETRY_DELAY)
-                else:
-                    # 4xx errors are not retryable
-                    raise GitHubAPIError(f"GitHub API error: {str(e)}")
-            
-            except Exception as e:
-                logger.error(f"Unexpected error in GitHub API call: {e}")
-                raise GitHubAPIError(f"Unexpected error: {str(e)}")
-        
-        raise GitHubAPIError(f"Failed after {self.MAX_RETRIES} retries")
+        def _log_before_sleep(retry_state):
+            logger.warning(
+                f"GitHub API call failed (attempt {retry_state.attempt_number}), "
+                f"retrying in {retry_state.next_action.sleep:.1f}s: "
+                f"{retry_state.outcome.exception()}"
+            )
+
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(self.MAX_RETRIES),
+                wait=self._retry_wait,
+                retry=retry_if_exception(_is_retryable),
+                before_sleep=_log_before_sleep,
+                reraise=True,
+            ):
+                with attempt:
+                    if asyncio.iscoroutinefunction(func):
+                        return await func(*args, **kwargs)
+                    async with _GITHUB_THREAD_SEMAPHORE:
+                        return await asyncio.to_thread(func, *args, **kwargs)
+
+        except RateLimitExceededException as e:
+            logger.error(f"Rate limit exceeded after {self.MAX_RETRIES} retries")
+            raise GitHubRateLimitError(f"GitHub rate limit exceeded: {str(e)}")
+
+        except GithubException as e:
+            if e.status == 401:
+                logger.warning("Invalid GitHub token")
+                raise GitHubAuthenticationError("Invalid GitHub token")
+            raise GitHubAPIError(f"GitHub API error: {str(e)}")
+
+        except GitHubAPIError:
+            raise
+
+        except Exception as e:
+            logger.error(f"Unexpected error in GitHub API call: {e}")
+            raise GitHubAPIError(f"Unexpected error: {str(e)}")
     
     # ========================================================================
     # Authentication Operations
@@ -153,64 +436,77 @@ class GitHubClient:
             GitHubAuthenticationError: If token is invalid
             GitHubAPIError: If API call fails
         """
-        try:
-            async def _validate():
-                github_user = self._github.get_user()
-                
-                # Attempt to fetch user data to validate token
-                user_data = User(
-                    id=github_user.id,
-                    login=github_user.login,
-                    name=github_user.name or github_user.login,
-                    email=github_user.email,
-                    avatar_url=github_user.avatar_url,
-                    html_url=github_user.html_url,
-                    type=github_user.type,
-                    site_admin=github_user.site_admin,
-                    public_repos=github_user.public_repos,
-                    followers=github_user.followers,
-                    following=github_user.following,
-                    created_at=github_user.created_at
-                )
-                
-                return True, user_data
-            
-            return await self._retry_with_backoff(_validate)
-        
-        except GithubException as e:
-            if e.status == 401:
-                logger.warning("Invalid GitHub token")
-                raise GitHubAuthenticationError("Invalid GitHub token")
-            raise GitHubAPIError(f"Failed to validate token: {str(e)}")
+        async def _validate():
+            data = await self._rest("GET", "/user")
+
+            user_data = User(
+                id=data["id"],
+                login=data["login"],
+                name=data.get("name") or data["login"],
+                email=data.get("email"),
+                avatar_url=data["avatar_url"],
+                html_url=data["html_url"],
+                type=data.get("type", "User"),
+                site_admin=data.get("site_admin", False),
+                public_repos=data.get("public_repos"),
+                followers=data.get("followers"),
+                following=data.get("following"),
+                created_at=data.get("created_at")
+            )
+
+            return True, user_data
+
+        return await self._retry_with_backoff(_validate)
     
-    def get_token_scopes(self) -> List[TokenScope]:
+    async def get_token_scopes(self) -> List[TokenScope]:
         """
         Get scopes associated with the token.
-        
+
+        GitHub reports the granted scopes in the X-OAuth-Scopes response
+        header of any authenticated request, so one HEAD request replaces
+        the old capability probes (a repo list fetch per scope).
+
         Returns:
-            List of TokenScope enums
+            List of TokenScope enums (for fine-grained PATs, which don't
+            carry the header, a single minimal probe checks repo access)
         """
-        # PyGithub doesn't expose OAuth scopes directly
-        # We'll verify minimum required scopes through capability checks
-        scopes = []
-        
-        try:
-            # Check repo scope
-            user = self._github.get_user()
-            repos = user.get_repos(affiliation="owner", max_results=1)
-            list(repos)  # Force evaluation
-            scopes.append(TokenScope.REPO)
-        except:
-            pass
-        
-        try:
-            # Check user scope
-            user = self._github.get_user()
-            _ = user.email
-            scopes.append(TokenScope.USER)
-        except:
-            pass
-        
+        # Scopes only change on re-auth; cache per token so middleware
+        # polling doesn't re-probe GitHub on every request
+        cache_key = f"scopes:{self._token_hash}"
+        cached = storage.cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        async def _fetch_scopes() -> List[TokenScope]:
+            session = await self._get_session()
+            async with session.head(
+                f"{GITHUB_API_BASE}/user", headers=self._auth_headers()
+            ) as resp:
+                if resp.status >= 400:
+                    raise GithubException(resp.status, {"message": resp.reason}, dict(resp.headers))
+                granted = resp.headers.get("X-OAuth-Scopes")
+
+            if granted is None:
+                # Fine-grained PATs don't carry the header; fall back to a
+                # single minimal probe (per_page=1, body discarded) rather
+                # than materializing a repo list
+                try:
+                    await self._rest("GET", "/user/repos", params={"affiliation": "owner", "per_page": 1})
+                    return [TokenScope.REPO]
+                except GithubException:
+                    return []
+
+            granted_set = {s.strip() for s in granted.split(",") if s.strip()}
+            scopes = [
+                scope for scope in TokenScope
+                if scope.value in granted_set
+            ]
+            if TokenScope.USER not in scopes and "user:email" in granted_set:
+                scopes.append(TokenScope.USER)
+            return scopes
+
+        scopes = await self._retry_with_backoff(_fetch_scopes)
+        storage.cache_set(cache_key, scopes, ttl_seconds=self.CACHE_TTL_SCOPES)
         return scopes
     
     # ========================================================================
@@ -223,18 +519,20 @@ class GitHubClient:
         sort: str = "updated",
         page: int = 1,
         per_page: int = 30,
-        use_cache: bool = True
+        use_cache: bool = True,
+        allow_stale: bool = True
     ) -> List[Repository]:
         """
         Get user's repositories with caching.
-        
+
         Args:
             visibility: Filter by "public", "private", or None for all
             sort: Sort by "created", "updated", "pushed", "full_name"
             page: Page number (1-indexed)
             per_page: Results per page (max 100)
             use_cache: Whether to use cached results
-        
+            allow_stale: Serve an expired cache entry if GitHub is unreachable
+
         Returns:
             List of Repository models
         """
@@ -245,139 +543,268 @@ class GitHubClient:
             cached = storage.cache_get(cache_key)
             if cached:
                 logger.debug(f"Cache hit for repositories: {cache_key}")
-                return cached
+                return _REPO_LIST_ADAPTER.validate_json(cached)
         
         async def _get_repos():
-            user = self._github.get_user()
-            
-            # Get repositories
-            # Note: PyGithub uses 'type' parameter, not 'visibility'
-            github_repos = user.get_repos(
-                type=visibility or "all",
-                sort=sort
+            # Note: the REST endpoint uses 'type' parameter, not 'visibility'
+            data = await self._rest(
+                "GET", "/user/repos",
+                params={
+                    "type": visibility or "all",
+                    "sort": sort,
+                    "page": page,
+                    # GitHub caps per_page at 100; clamp rather than let
+                    # the API silently return a short page
+                    "per_page": min(per_page, 100)
+                },
+                # mercy-preview includes topics in the list response,
+                # avoiding a get_topics() call per repository
+                headers={"Accept": "application/vnd.github+json, application/vnd.github.mercy-preview+json"}
             )
-            
-            # Convert to Repository models (paginated)
-            repos = []
-            for i, repo in enumerate(github_repos):
-                # Manual pagination
-                if i < (page - 1) * per_page:
-                    continue
-                if i >= page * per_page:
-                    break
-                
-                repos.append(self._convert_repository(repo))
-            
+
+            return [self._convert_repository_dict(raw) for raw in data]
+
+        async def _fetch_and_store():
+            try:
+                repos = await self._retry_with_backoff(_get_repos)
+            except GitHubAuthenticationError:
+                raise
+            except GitHubAPIError:
+                if allow_stale:
+                    stale_repos = storage.cache_get_stale(cache_key)
+                    if stale_repos is not None:
+                        logger.warning(f"Serving stale repositories for {cache_key} after upstream failure")
+                        return _REPO_LIST_ADAPTER.validate_json(stale_repos)
+                raise
+
+            # Cache results
+            storage.cache_set(cache_key, _REPO_LIST_ADAPTER.dump_json(repos), ttl_seconds=self.CACHE_TTL_REPOSITORIES)
+
+            # Speculatively warm the next page in the background: the common
+            # "load repo list, then paginate" flow then hits cache. A full page
+            # is the best signal we have that another page exists.
+            if use_cache and page == 1 and len(repos) == per_page:
+                self._prefetch_page(visibility, sort, page + 1, per_page)
+
             return repos
-        
-        repos = await self._retry_with_backoff(_get_repos)
-        
-        # Cache results
-        storage.cache_set(cache_key, repos, ttl_seconds=self.CACHE_TTL_REPOSITORIES)
-        
-        return repos
+
+        return await self._single_flight(cache_key, _fetch_and_store)
+
+    def _prefetch_page(self, visibility: Optional[str], sort: str, page: int, per_page: int) -> None:
+        """Kick off a background fetch that populates the cache for a page."""
+        prefetch_key = f"repos:{visibility}:{sort}:{page}:{per_page}"
+        if prefetch_key in self._prefetched or storage.cache_get(prefetch_key):
+            return
+        self._prefetched.add(prefetch_key)
+
+        async def _prefetch():
+            try:
+                await self.get_repositories(
+                    visibility=visibility, sort=sort, page=page,
+                    per_page=per_page, use_cache=True
+                )
+            except GitHubAPIError as e:
+                logger.debug(f"Prefetch of {prefetch_key} failed: {e}")
+
+        task = asyncio.create_task(_prefetch())
+        _BACKGROUND_TASKS.add(task)
+        task.add_done_callback(_BACKGROUND_TASKS.discard)
     
-    def _convert_repository(self, github_repo: GithubRepository) -> Repository:
-        """Convert PyGithub Repository to our Repository model."""
-        # Convert permissions object to dict if it exists
-        permissions = getattr(github_repo, "permissions", None)
-        if permissions is not None and hasattr(permissions, '__dict__'):
-            # Convert PyGithub Permissions object to dict
-            permissions = {
-                "admin": getattr(permissions, "admin", False),
-                "push": getattr(permissions, "push", False),
-                "pull": getattr(permissions, "pull", False),
-            }
-        
+    @staticmethod
+    def _convert_repository_dict(raw: Dict[str, Any]) -> Repository:
+        """Build a Repository model from a GitHub API repository JSON dict.
+
+        Pure dict lookups only — no PyGithub objects, so no per-attribute
+        lazy completion fetches and no extra topics request per repo.
+        """
+        owner = raw.get("owner") or {}
         return Repository(
-            id=github_repo.id,
-            node_id=github_repo.node_id,
-            name=github_repo.name,
-            full_name=github_repo.full_name,
+            id=raw["id"],
+            node_id=raw["node_id"],
+            name=raw["name"],
+            full_name=raw["full_name"],
             owner={
-                "login": github_repo.owner.login,
-                "id": github_repo.owner.id,
-                "avatar_url": github_repo.owner.avatar_url,
-                "type": github_repo.owner.type
+                "login": owner.get("login"),
+                "id": owner.get("id"),
+                "avatar_url": owner.get("avatar_url"),
+                "type": owner.get("type")
             },
-            private=github_repo.private,
-            description=github_repo.description,
-            html_url=github_repo.html_url,
-            url=github_repo.url,
-            clone_url=github_repo.clone_url,
-            git_url=github_repo.git_url,
-            ssh_url=github_repo.ssh_url,
-            default_branch=github_repo.default_branch,
-            created_at=github_repo.created_at,
-            updated_at=github_repo.updated_at,
-            pushed_at=github_repo.pushed_at,
-            size=github_repo.size,
-            stargazers_count=github_repo.stargazers_count,
-            watchers_count=github_repo.watchers_count,
-            forks_count=github_repo.forks_count,
-            open_issues_count=github_repo.open_issues_count,
-            has_issues=github_repo.has_issues,
-            has_projects=getattr(github_repo, "has_projects", False),
-            has_wiki=github_repo.has_wiki,
-            has_pages=getattr(github_repo, "has_pages", False),
-            has_downloads=getattr(github_repo, "has_downloads", False),
-            archived=github_repo.archived,
-            disabled=getattr(github_repo, "disabled", False),
-            visibility=getattr(github_repo, "visibility", "private" if github_repo.private else "public"),
-            permissions=permissions,
-            language=github_repo.language,
-            topics=github_repo.get_topics() if hasattr(github_repo, "get_topics") else []
+            private=raw["private"],
+            description=raw.get("description"),
+            html_url=raw["html_url"],
+            url=raw["url"],
+            clone_url=raw["clone_url"],
+            git_url=raw["git_url"],
+            ssh_url=raw["ssh_url"],
+            default_branch=raw.get("default_branch", "main"),
+            created_at=raw["created_at"],
+            updated_at=raw["updated_at"],
+            pushed_at=raw.get("pushed_at"),
+            size=raw.get("size"),
+            stargazers_count=raw.get("stargazers_count"),
+            watchers_count=raw.get("watchers_count"),
+            forks_count=raw.get("forks_count"),
+            open_issues_count=raw.get("open_issues_count"),
+            has_issues=raw.get("has_issues", True),
+            has_projects=raw.get("has_projects", False),
+            has_wiki=raw.get("has_wiki", True),
+            has_pages=raw.get("has_pages", False),
+            has_downloads=raw.get("has_downloads", False),
+            archived=raw.get("archived", False),
+            disabled=raw.get("disabled", False),
+            visibility=raw.get("visibility", "private" if raw["private"] else "public"),
+            permissions=raw.get("permissions"),
+            language=raw.get("language"),
+            topics=raw.get("topics", [])
         )
     
     # ========================================================================
     # Branch Operations
     # ========================================================================
     
-    async def get_branches(self, repo_full_name: str, use_cache: bool = True) -> List[Branch]:
+    async def get_branches(self, repo_full_name: str, use_cache: bool = True, allow_stale: bool = True) -> List[Branch]:
         """
         Get branches for a repository.
-        
+
         Args:
             repo_full_name: Repository full name (owner/repo)
             use_cache: Whether to use cached results
-        
+            allow_stale: Serve an expired cache entry if GitHub is unreachable
+
         Returns:
             List of Branch models
         """
         cache_key = f"branches:{repo_full_name}"
-        
-        # Check cache
+
+        # Check cache; expired entries with an ETag are kept for
+        # conditional revalidation instead of discarded
+        stale: Optional[Dict[str, Any]] = None
         if use_cache:
             cached = storage.cache_get(cache_key)
-            if cached:
-                logger.debug(f"Cache hit for branches: {cache_key}")
-                return cached
-        
-        async def _get_branches():
-            repo = self._github.get_repo(repo_full_name)
-            github_branches = repo.get_branches()
-            
-            branches = [
-                Branch(
-                    name=branch.name,
-                    commit=Commit(
-                        sha=branch.commit.sha,
-                        url=branch.commit.url
-                    ),
-                    protected=branch.protected,
-                    protection_url=branch.protection_url if hasattr(branch, "protection_url") else None
+            if isinstance(cached, dict):
+                if cached["fresh_until"] > time.monotonic():
+                    logger.debug(f"Cache hit for branches: {cache_key}")
+                    return _BRANCH_LIST_ADAPTER.validate_json(cached["value"])
+                if cached.get("etag"):
+                    stale = cached
+
+        async def _get_branches() -> Tuple[List[Branch], Optional[str]]:
+            branches = []
+            etag: Optional[str] = None
+            page = 1
+            while True:
+                cond_headers = {"If-None-Match": stale["etag"]} if (stale and page == 1) else None
+                data, resp_headers = await self._rest(
+                    "GET", f"/repos/{repo_full_name}/branches",
+                    params={"per_page": 100, "page": page},
+                    headers=cond_headers,
+                    return_headers=True
                 )
-                for branch in github_branches
-            ]
-            
+                if data is None and stale is not None:
+                    # 304 Not Modified: listing unchanged since we cached it
+                    logger.debug(f"ETag revalidated (304) for branches: {cache_key}")
+                    return _BRANCH_LIST_ADAPTER.validate_json(stale["value"]), stale["etag"]
+                if page == 1:
+                    etag = resp_headers.get("ETag")
+                branches.extend(
+                    Branch(
+                        name=item["name"],
+                        commit=Commit(
+                            sha=item["commit"]["sha"],
+                            url=item["commit"]["url"]
+                        ),
+                        protected=item.get("protected", False),
+                        protection_url=item.get("protection_url")
+                    )
+                    for item in data
+                )
+                if len(data) < 100:
+                    break
+                page += 1
+
+            return branches, etag
+
+        async def _fetch_and_store():
+            etag: Optional[str] = None
+            try:
+                if stale is not None:
+                    # Revalidate over REST first: a 304 is an empty response that
+                    # costs no rate-limit quota, whereas GraphQL always pays
+                    branches, etag = await self._retry_with_backoff(_get_branches)
+                else:
+                    try:
+                        # Preferred path: one GraphQL round-trip for all branches with
+                        # commit SHA and protection state, instead of paged REST plus
+                        # per-branch lazy attribute fetches
+                        branches = await self._get_branches_graphql(repo_full_name)
+                    except GitHubAuthenticationError:
+                        raise
+                    except (GitHubAPIError, aiohttp.ClientError) as e:
+                        logger.warning(f"GraphQL branch fetch failed for {repo_full_name}, falling back to REST: {e}")
+                        branches, etag = await self._retry_with_backoff(_get_branches)
+            except GitHubAuthenticationError:
+                raise
+            except GitHubAPIError:
+                if allow_stale:
+                    stale_entry = storage.cache_get_stale(cache_key)
+                    if isinstance(stale_entry, dict):
+                        logger.warning(f"Serving stale branches for {cache_key} after upstream failure")
+                        return _BRANCH_LIST_ADAPTER.validate_json(stale_entry["value"])
+                raise
+
+            # Cache results
+            storage.cache_set(
+                cache_key,
+                {
+                    "etag": etag,
+                    "value": _BRANCH_LIST_ADAPTER.dump_json(branches),
+                    "fresh_until": time.monotonic() + self.CACHE_TTL_BRANCHES
+                },
+                ttl_seconds=self.CACHE_TTL_ETAG_RETENTION
+            )
+            storage.save_branches(repo_full_name, branches)
+
             return branches
-        
-        branches = await self._retry_with_backoff(_get_branches)
-        
-        # Cache results
-        storage.cache_set(cache_key, branches, ttl_seconds=self.CACHE_TTL_BRANCHES)
-        storage.save_branches(repo_full_name, branches)
-        
+
+        return await self._single_flight(cache_key, _fetch_and_store)
+
+    async def _get_branches_graphql(self, repo_full_name: str) -> List[Branch]:
+        """Fetch all branches for a repository via a batched GraphQL query."""
+        owner, _, name = repo_full_name.partition("/")
+
+        branches = []
+        cursor: Optional[str] = None
+        while True:
+            data = await self._graphql(_BRANCHES_QUERY, {"owner": owner, "name": name, "cursor": cursor})
+            repository = data.get("repository")
+            if repository is None:
+                raise GitHubAPIError(f"Repository not found: {repo_full_name}")
+
+            refs = repository["refs"]
+            for node in refs["nodes"]:
+                branch_name = node["name"]
+                sha = node["target"]["oid"]
+                protected = node["branchProtectionRule"] is not None
+                branches.append(
+                    Branch(
+                        name=branch_name,
+                        commit=Commit(
+                            sha=sha,
+                            url=f"https://api.github.com/repos/{repo_full_name}/commits/{sha}"
+                        ),
+                        protected=protected,
+                        protection_url=(
+                            f"https://api.github.com/repos/{repo_full_name}/branches/{branch_name}/protection"
+                            if protected else None
+                        )
+                    )
+                )
+
+            page_info = refs["pageInfo"]
+            if not page_info["hasNextPage"]:
+                break
+            cursor = page_info["endCursor"]
+
         return branches
     
     async def create_branch(self, repo_full_name: str, branch_name: str, from_branch: str = "main") -> Branch:
@@ -396,33 +823,51 @@ class GitHubClient:
             GitHubAPIError: If branch creation fails
         """
         async def _create():
-            repo = self._github.get_repo(repo_full_name)
-            
             # Get base branch
-            base_branch = repo.get_branch(from_branch)
-            base_sha = base_branch.commit.sha
-            
+            base_branch = await self._rest("GET", f"/repos/{repo_full_name}/branches/{from_branch}")
+            base_sha = base_branch["commit"]["sha"]
+
             # Create new branch reference
-            ref = repo.create_git_ref(
-                ref=f"refs/heads/{branch_name}",
-                sha=base_sha
+            await self._rest(
+                "POST", f"/repos/{repo_full_name}/git/refs",
+                json_body={"ref": f"refs/heads/{branch_name}", "sha": base_sha}
             )
-            
+
             # Get the created branch
-            new_branch = repo.get_branch(branch_name)
-            
-            # Invalidate cache
-            storage.cache_invalidate(f"branches:{repo_full_name}")
-            
-            return Branch(
-                name=new_branch.name,
+            new_branch = await self._rest("GET", f"/repos/{repo_full_name}/branches/{branch_name}")
+
+            created = Branch(
+                name=new_branch["name"],
                 commit=Commit(
-                    sha=new_branch.commit.sha,
-                    url=new_branch.commit.url
+                    sha=new_branch["commit"]["sha"],
+                    url=new_branch["commit"]["url"]
                 ),
-                protected=new_branch.protected,
-                protection_url=new_branch.protection_url if hasattr(new_branch, "protection_url") else None
+                protected=new_branch.get("protected", False),
+                protection_url=new_branch.get("protection_url")
             )
+
+            # Write-through: splice the new branch into the cached listing
+            # instead of discarding it. The stored ETag is dropped — the
+            # upstream listing changed, so it would revalidate wrongly.
+            branches_key = f"branches:{repo_full_name}"
+            cached = storage.cache_get(branches_key)
+            if isinstance(cached, dict):
+                branches = _BRANCH_LIST_ADAPTER.validate_json(cached["value"])
+                branches = [b for b in branches if b.name != created.name]
+                branches.append(created)
+                storage.cache_set(
+                    branches_key,
+                    {
+                        "etag": None,
+                        "value": _BRANCH_LIST_ADAPTER.dump_json(branches),
+                        "fresh_until": cached["fresh_until"]
+                    },
+                    ttl_seconds=self.CACHE_TTL_ETAG_RETENTION
+                )
+            else:
+                storage.cache_invalidate(branches_key)
+
+            return created
         
         return await self._retry_with_backoff(_create)
 
@@ -447,89 +892,187 @@ class GitHubClient:
         Returns:
             List of discovered Feature models
         """
+        sem = asyncio.Semaphore(10)
+
+        # One timestamp per discovery run instead of two datetime.utcnow()
+        # allocations per discovered feature
+        discovered_at = datetime.utcnow()
+
+        # Stable feature ids: SHA-1 over "repo:branch:dir". The repo/branch
+        # prefix is hashed once per branch and the hasher copied per
+        # directory, instead of a full uuid5 evaluation per directory.
+        _branch_hashers: Dict[str, Any] = {}
+
+        def _feature_id(scan_branch: str, dir_path: str) -> str:
+            hasher = _branch_hashers.get(scan_branch)
+            if hasher is None:
+                hasher = hashlib.sha1(f"{repo_full_name}:{scan_branch}:".encode())
+                _branch_hashers[scan_branch] = hasher
+            h = hasher.copy()
+            h.update(dir_path.encode())
+            return f"feat_{h.hexdigest()[:16]}"
+
+        async def _scan_dir(scan_branch: str, default_branch: str, dir_path: str, slug: str) -> Optional[Feature]:
+            try:
+                async with sem:
+                    child_entries = await self._rest(
+                        "GET", f"/repos/{repo_full_name}/contents/{dir_path}",
+                        params={"ref": scan_branch}
+                    )
+            except GithubException:
+                return None
+
+            if not isinstance(child_entries, list):
+                return None
+
+            file_names = {child["name"] for child in child_entries}
+            return _feature_from_files(scan_branch, default_branch, dir_path, slug, file_names)
+
+        def _feature_from_files(scan_branch: str, default_branch: str, dir_path: str,
+                                slug: str, file_names: Set[str]) -> Optional[Feature]:
+            if "spec.md" not in file_names:
+                return None
+            feature_id = _feature_id(scan_branch, dir_path)
+            logger.info(f"[Discovery] {repo_full_name}/{scan_branch}: Found feature '{slug}' in {dir_path}")
+            return Feature(
+                feature_id=feature_id,
+                repository_full_name=repo_full_name,
+                branch_name=scan_branch,
+                base_branch=default_branch,
+                title=slug.replace("-", " ").replace("_", " ").title(),
+                status=FeatureStatus.ACTIVE,
+                spec_path=f"{dir_path}/spec.md",
+                plan_path=f"{dir_path}/plan.md" if "plan.md" in file_names else None,
+                task_path=f"{dir_path}/tasks.md" if "tasks.md" in file_names else None,
+                created_at=discovered_at,
+                updated_at=discovered_at,
+                created_by_user_id=created_by_user_id,
+            )
+
+        async def _scan_branch_contents(scan_branch: str, default_branch: str) -> List[Feature]:
+            # Slow path: one contents call per spec directory. Only used when
+            # the tree response is truncated (>100k entries).
+            try:
+                async with sem:
+                    specs_entries = await self._rest(
+                        "GET", f"/repos/{repo_full_name}/contents/specs",
+                        params={"ref": scan_branch}
+                    )
+                logger.info(f"[Discovery] {repo_full_name}/{scan_branch}: Found specs directory")
+            except GithubException as e:
+                if e.status == 404:
+                    logger.debug(f"[Discovery] {repo_full_name}/{scan_branch}: No specs directory (404)")
+                    return []
+                logger.warning(f"[Discovery] {repo_full_name}/{scan_branch}: Error accessing specs: {e}")
+                raise
+
+            if not isinstance(specs_entries, list):
+                return []
+
+            features = await asyncio.gather(*[
+                _scan_dir(scan_branch, default_branch, entry["path"], entry["name"])
+                for entry in specs_entries
+                if entry.get("type") == "dir"
+            ])
+            return [f for f in features if f is not None]
+
+        async def _scan_branch(scan_branch: str, default_branch: str) -> List[Feature]:
+            try:
+                async with sem:
+                    branch_info = await self._rest(
+                        "GET", f"/repos/{repo_full_name}/branches/{scan_branch}"
+                    )
+                sha = branch_info["commit"]["sha"]
+                async with sem:
+                    tree = await self._rest(
+                        "GET", f"/repos/{repo_full_name}/git/trees/{sha}",
+                        params={"recursive": "1"}
+                    )
+            except GithubException as e:
+                if e.status == 404:
+                    logger.debug(f"[Discovery] {repo_full_name}/{scan_branch}: Branch or tree not found (404)")
+                    return []
+                logger.warning(f"[Discovery] {repo_full_name}/{scan_branch}: Error fetching tree: {e}")
+                raise
+
+            if tree.get("truncated"):
+                logger.warning(f"[Discovery] {repo_full_name}/{scan_branch}: Tree truncated, falling back to contents walk")
+                return await _scan_branch_contents(scan_branch, default_branch)
+
+            # One round-trip gives every blob on the branch; group the
+            # specs/<slug>/<file> entries by directory in-memory.
+            dir_files: Dict[str, Set[str]] = {}
+            for entry in tree.get("tree", []):
+                path = entry.get("path", "")
+                if entry.get("type") != "blob" or not path.startswith("specs/"):
+                    continue
+                parts = path.split("/")
+                if len(parts) != 3:
+                    continue
+                dir_files.setdefault(f"specs/{parts[1]}", set()).add(parts[2])
+
+            if dir_files:
+                logger.info(f"[Discovery] {repo_full_name}/{scan_branch}: Found specs directory")
+
+            features = [
+                _feature_from_files(scan_branch, default_branch, dir_path, dir_path.split("/")[1], file_names)
+                for dir_path, file_names in sorted(dir_files.items())
+            ]
+            return [f for f in features if f is not None]
+
         async def _discover() -> List[Feature]:
-            repo = self._github.get_repo(repo_full_name)
-            default_branch = repo.default_branch or "main"
+            repo_info = await self._rest("GET", f"/repos/{repo_full_name}")
+            default_branch = repo_info.get("default_branch") or "main"
 
             branches_to_scan: List[str] = [branch or default_branch]
             if branch is None:
                 try:
-                    repo_branches = list(repo.get_branches())
-                    feature_like = [
-                        b.name for b in repo_branches
-                        if b.name != default_branch and (
-                            b.name.startswith("feature/")
-                            or b.name.startswith("feat/")
-                            or b.name.startswith("spec/")
-                            or (b.name[0].isdigit() and "-" in b.name)  # Include numeric-prefixed branches like 001-feature
+                    # Page through branches only until the scan cap is hit;
+                    # repos with thousands of long-lived branches usually
+                    # fill the cap within the first page
+                    feature_like: List[str] = []
+                    page = 1
+                    while len(feature_like) < 30:
+                        repo_branches = await self._rest(
+                            "GET", f"/repos/{repo_full_name}/branches",
+                            params={"per_page": 100, "page": page}
                         )
-                    ]
-                    branches_to_scan.extend(feature_like[:30])
+                        for b in repo_branches:
+                            name = b["name"]
+                            if name != default_branch and _FEATURE_BRANCH_RE.match(name):
+                                feature_like.append(name)
+                                if len(feature_like) >= 30:
+                                    break
+                        if len(repo_branches) < 100:
+                            break
+                        page += 1
+                    branches_to_scan.extend(feature_like)
                     logger.info(f"[Discovery] {repo_full_name}: Found {len(feature_like)} feature branches to scan: {feature_like[:5]}")
                 except Exception as e:
                     logger.warning(f"[Discovery] {repo_full_name}: Failed to get branches: {e}")
                     pass
-            
+
             logger.info(f"[Discovery] {repo_full_name}: Scanning {len(branches_to_scan)} branches: {branches_to_scan}")
 
+            branch_results = await asyncio.gather(
+                *[_scan_branch(scan_branch, default_branch) for scan_branch in branches_to_scan],
+                return_exceptions=True
+            )
+
+            # De-duplicate after the fan-out; gather preserves branch order so
+            # the first branch containing a spec dir wins, as before.
             seen_feature_ids = set()
             discovered: List[Feature] = []
-
-            for scan_branch in branches_to_scan:
-                try:
-                    specs_entries = repo.get_contents("specs", ref=scan_branch)
-                    logger.info(f"[Discovery] {repo_full_name}/{scan_branch}: Found specs directory")
-                except GithubException as e:
-                    if e.status == 404:
-                        logger.debug(f"[Discovery] {repo_full_name}/{scan_branch}: No specs directory (404)")
-                        continue
-                    logger.warning(f"[Discovery] {repo_full_name}/{scan_branch}: Error accessing specs: {e}")
-                    raise
-
-                if not isinstance(specs_entries, list):
+            for scan_branch, result in zip(branches_to_scan, branch_results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"[Discovery] {repo_full_name}/{scan_branch}: Branch scan failed: {result}")
                     continue
-
-                for entry in specs_entries:
-                    if getattr(entry, "type", None) != "dir":
-                        continue
-
-                    dir_path = entry.path
-                    try:
-                        child_entries = repo.get_contents(dir_path, ref=scan_branch)
-                    except GithubException:
-                        continue
-
-                    if not isinstance(child_entries, list):
-                        continue
-
-                    file_names = {child.name for child in child_entries}
-                    if "spec.md" not in file_names:
+                for feature in result:
+                    if feature.feature_id in seen_feature_ids:
                         continue
+                    seen_feature_ids.add(feature.feature_id)
+                    discovered.append(feature)
 
-                    slug = entry.name
-                    feature_id = f"feat_{uuid.uuid5(uuid.NAMESPACE_URL, f'{repo_full_name}:{scan_branch}:{dir_path}').hex[:16]}"
-                    if feature_id in seen_feature_ids:
-                        continue
-
-                    seen_feature_ids.add(feature_id)
-                    logger.info(f"[Discovery] {repo_full_name}/{scan_branch}: Found feature '{slug}' in {dir_path}")
-                    discovered.append(
-                        Feature(
-                            feature_id=feature_id,
-                            repository_full_name=repo_full_name,
-                            branch_name=scan_branch,
-                            base_branch=default_branch,
-                            title=slug.replace("-", " ").replace("_", " ").title(),
-                            status=FeatureStatus.ACTIVE,
-                            spec_path=f"{dir_path}/spec.md",
-                            plan_path=f"{dir_path}/plan.md" if "plan.md" in file_names else None,
-                            task_path=f"{dir_path}/tasks.md" if "tasks.md" in file_names else None,
-                            created_at=datetime.utcnow(),
-                            updated_at=datetime.utcnow(),
-                            created_by_user_id=created_by_user_id,
-                        )
-                    )
-            
             logger.info(f"[Discovery] {repo_full_name}: Discovered {len(discovered)} features total")
             return discovered
 
@@ -539,118 +1082,195 @@ class GitHubClient:
     # File Operations
     # ========================================================================
     
-    async def read_file(self, repo_full_name: str, path: str, branch: str = "main", use_cache: bool = True) -> Tuple[str, str]:
+    async def read_file_raw(self, repo_full_name: str, path: str, branch: str = "main", use_cache: bool = True, allow_stale: bool = True) -> Tuple[str, str]:
         """
-        Read file contents from repository.
-        
+        Read file contents as the raw base64 payload GitHub returned.
+
+        Useful for binary files (where a UTF-8 decode would fail) and for
+        read -> write passthrough flows that would otherwise pay a decode
+        plus re-encode per round-trip.
+
         Args:
             repo_full_name: Repository full name (owner/repo)
             path: File path in repository
             branch: Branch name
             use_cache: Whether to use cached results
-        
+            allow_stale: Serve an expired cache entry if GitHub is unreachable
+
         Returns:
-            Tuple of (content, sha) for optimistic locking
-        
+            Tuple of (content_b64, sha) for optimistic locking
+
         Raises:
             GitHubAPIError: If file read fails
         """
         cache_key = f"file:{repo_full_name}:{branch}:{path}"
-        
-        # Check cache
+
+        # Check cache (including 404 tombstones); expired entries with an
+        # ETag are kept for conditional revalidation instead of discarded
+        stale: Optional[Dict[str, Any]] = None
         if use_cache:
             cached = storage.cache_get(cache_key)
-            if cached:
-                logger.debug(f"Cache hit for file: {cache_key}")
-                return cached
-        
-        async def _read():
-            repo = self._github.get_repo(repo_full_name)
-            
+            if cached is _FILE_MISSING:
+                logger.debug(f"Negative cache hit for file: {cache_key}")
+                raise GitHubAPIError(f"File not found: {path}")
+            if isinstance(cached, dict):
+                if cached["fresh_until"] > time.monotonic():
+                    logger.debug(f"Cache hit for file: {cache_key}")
+                    return cached["value"]
+                if cached.get("etag"):
+                    stale = cached
+
+        async def _read() -> Tuple[Tuple[str, str], Optional[str]]:
+            cond_headers = {"If-None-Match": stale["etag"]} if stale else None
             try:
-                file_content = repo.get_contents(path, ref=branch)
-                
-                if isinstance(file_content, list):
-                    raise GitHubAPIError(f"Path is a directory, not a file: {path}")
-                
-                content = file_content.decoded_content.decode('utf-8')
-                sha = file_content.sha
-                
-                return content, sha
-            
+                data, resp_headers = await self._rest(
+                    "GET", f"/repos/{repo_full_name}/contents/{path}",
+                    params={"ref": branch},
+                    headers=cond_headers,
+                    return_headers=True
+                )
             except GithubException as e:
                 if e.status == 404:
+                    # Negative-cache the miss so polling workflows don't
+                    # hammer GitHub for a file that doesn't exist yet
+                    storage.cache_set(cache_key, _FILE_MISSING, ttl_seconds=self.CACHE_TTL_MISSING_FILES)
                     raise GitHubAPIError(f"File not found: {path}")
                 raise
-        
-        result = await self._retry_with_backoff(_read)
-        
-        # Cache results
-        storage.cache_set(cache_key, result, ttl_seconds=self.CACHE_TTL_FILES)
-        
-        return result
+
+            if data is None and stale is not None:
+                # 304 Not Modified: file unchanged since we cached it
+                logger.debug(f"ETag revalidated (304) for file: {cache_key}")
+                return stale["value"], stale["etag"]
+
+            if isinstance(data, list):
+                raise GitHubAPIError(f"Path is a directory, not a file: {path}")
+
+            # data["content"] is the base64 payload from the API; strip
+            # the newlines GitHub inserts but skip decoding
+            content_b64 = "".join(data["content"].split())
+
+            return (content_b64, data["sha"]), resp_headers.get("ETag")
+
+        async def _fetch_and_store():
+            try:
+                result, etag = await self._retry_with_backoff(_read)
+            except GitHubAuthenticationError:
+                raise
+            except GitHubAPIError:
+                # A genuine 404 just set the tombstone; don't resurrect a
+                # deleted file from stale cache
+                if allow_stale and storage.cache_get(cache_key) is not _FILE_MISSING:
+                    stale_entry = storage.cache_get_stale(cache_key)
+                    if isinstance(stale_entry, dict):
+                        logger.warning(f"Serving stale file for {cache_key} after upstream failure")
+                        return stale_entry["value"]
+                raise
+
+            # Cache results
+            storage.cache_set(
+                cache_key,
+                {"etag": etag, "value": result, "fresh_until": time.monotonic() + self.CACHE_TTL_FILES},
+                ttl_seconds=self.CACHE_TTL_ETAG_RETENTION
+            )
+
+            return result
+
+        return await self._single_flight(cache_key, _fetch_and_store)
+
+    async def read_file(self, repo_full_name: str, path: str, branch: str = "main", use_cache: bool = True) -> Tuple[str, str]:
+        """
+        Read file contents from repository.
+
+        Args:
+            repo_full_name: Repository full name (owner/repo)
+            path: File path in repository
+            branch: Branch name
+            use_cache: Whether to use cached results
+
+        Returns:
+            Tuple of (content, sha) for optimistic locking
+
+        Raises:
+            GitHubAPIError: If file read fails
+        """
+        content_b64, sha = await self.read_file_raw(repo_full_name, path, branch, use_cache=use_cache)
+        return base64.b64decode(content_b64).decode('utf-8'), sha
     
     async def write_file(
         self,
         repo_full_name: str,
         path: str,
-        content: str,
-        message: str,
+        content: Optional[str] = None,
+        message: str = "",
         branch: str = "main",
-        sha: Optional[str] = None
+        sha: Optional[str] = None,
+        content_b64: Optional[str] = None
     ) -> str:
         """
         Write file contents to repository.
-        
+
         Args:
             repo_full_name: Repository full name (owner/repo)
             path: File path in repository
-            content: File content to write
+            content: File content to write (UTF-8 text)
             message: Commit message
             branch: Branch name
             sha: Existing file SHA for optimistic locking (None for new files)
-        
+            content_b64: Base64 payload (e.g. from read_file_raw) to write
+                instead of content; skips the UTF-8 codec pass and supports
+                binary files
+
         Returns:
             New file SHA
-        
+
         Raises:
             GitHubAPIError: If file write fails or SHA mismatch
         """
+        if content_b64 is not None:
+            # Pass the base64 payload through verbatim (just strip any
+            # newlines GitHub inserted on the way out)
+            encoded = "".join(content_b64.split())
+        elif content is not None:
+            encoded = base64.b64encode(content.encode('utf-8')).decode('ascii')
+        else:
+            raise GitHubAPIError(f"Either content or content_b64 is required to write: {path}")
+
         async def _write():
-            repo = self._github.get_repo(repo_full_name)
-            
+            body = {
+                "message": message,
+                "content": encoded,
+                "branch": branch
+            }
+            if sha:
+                # Update existing file (optimistic locking)
+                body["sha"] = sha
+
             try:
-                if sha:
-                    # Update existing file
-                    result = repo.update_file(
-                        path=path,
-                        message=message,
-                        content=content,
-                        sha=sha,
-                        branch=branch
-                    )
-                else:
-                    # Create new file
-                    result = repo.create_file(
-                        path=path,
-                        message=message,
-                        content=content,
-                        branch=branch
-                    )
-                
-                # Invalidate cache
-                cache_key = f"file:{repo_full_name}:{branch}:{path}"
-                storage.cache_invalidate(cache_key)
-                
-                return result["content"].sha
-            
+                result = await self._rest(
+                    "PUT", f"/repos/{repo_full_name}/contents/{path}",
+                    json_body=body
+                )
             except GithubException as e:
                 if e.status == 409:
                     raise GitHubAPIError(f"File SHA mismatch (optimistic locking conflict): {path}")
                 elif e.status == 422:
                     raise GitHubAPIError(f"Invalid file content or path: {path}")
                 raise
-        
+
+            new_sha = result["content"]["sha"]
+
+            # Write-through: the content is already in hand, so populate
+            # the read cache (clearing any 404 tombstone) instead of just
+            # invalidating — the next read_file is a hit, not a round-trip
+            cache_key = f"file:{repo_full_name}:{branch}:{path}"
+            storage.cache_set(
+                cache_key,
+                {"etag": None, "value": (encoded, new_sha), "fresh_until": time.monotonic() + self.CACHE_TTL_FILES},
+                ttl_seconds=self.CACHE_TTL_ETAG_RETENTION
+            )
+
+            return new_sha
+
         return await self._retry_with_backoff(_write)
     
     async def get_file_sha(self, repo_full_name: str, path: str, branch: str = "main") -> Optional[str]:
@@ -665,9 +1285,33 @@ class GitHubClient:
         Returns:
             File SHA or None if file doesn't exist
         """
+        # Honor the 404 tombstone even though positive results are always
+        # fetched fresh (a stale SHA would break optimistic locking)
+        cache_key = f"file:{repo_full_name}:{branch}:{path}"
+        if storage.cache_get(cache_key) is _FILE_MISSING:
+            return None
+
+        async def _get_sha() -> Optional[str]:
+            try:
+                data = await self._rest(
+                    "GET", f"/repos/{repo_full_name}/contents/{path}",
+                    params={"ref": branch}
+                )
+            except GithubException as e:
+                if e.status == 404:
+                    storage.cache_set(cache_key, _FILE_MISSING, ttl_seconds=self.CACHE_TTL_MISSING_FILES)
+                    return None
+                raise
+
+            if isinstance(data, list):
+                # Directories have no single SHA
+                return None
+            # Only the metadata is needed; skip the base64 strip/decode
+            # that read_file would pay on the content payload
+            return data["sha"]
+
         try:
-            _, sha = await self.read_file(repo_full_name, path, branch, use_cache=False)
-            return sha
+            return await self._retry_with_backoff(_get_sha)
         except GitHubAPIError:
             return None
     
@@ -675,26 +1319,66 @@ class GitHubClient:
     # Rate Limit Information
     # ========================================================================
     
+    # Maximum snapshot age before refresh_rate_limit_status re-fetches
+    RATE_LIMIT_SNAPSHOT_MAX_AGE = 30  # seconds
+
     def get_rate_limit_status(self) -> Dict[str, Any]:
         """
-        Get current rate limit status.
-        
+        Get the most recent rate limit snapshot.
+
+        Pure in-memory read, safe to call from request handlers and
+        observability endpoints; use refresh_rate_limit_status() to
+        (re)populate the snapshot from GitHub.
+
+        Returns:
+            Dict with rate limit information (empty until first refresh)
+        """
+        return self._rl_snapshot
+
+    async def refresh_rate_limit_status(self, max_age_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Refresh the rate limit snapshot if it is older than max_age_seconds.
+
+        Args:
+            max_age_seconds: Snapshot freshness threshold (defaults to
+                RATE_LIMIT_SNAPSHOT_MAX_AGE)
+
         Returns:
             Dict with rate limit information
         """
-        rate_limit = self._github.get_rate_limit()
-        
-        return {
-            "core": {
-                "limit": rate_limit.core.limit,
-                "remaining": rate_limit.core.remaining,
-                "reset": rate_limit.core.reset,
-                "used": rate_limit.core.used
-            },
-            "search": {
-                "limit": rate_limit.search.limit,
-                "remaining": rate_limit.search.remaining,
-                "reset": rate_limit.search.reset,
-                "used": rate_limit.search.used
+        max_age = max_age_seconds if max_age_seconds is not None else self.RATE_LIMIT_SNAPSHOT_MAX_AGE
+        if self._rl_snapshot and time.monotonic() - self._rl_snapshot_at < max_age:
+            return self._rl_snapshot
+
+        # Shared cache so multiple client instances for the same token
+        # (one per request handler) don't each poll GitHub
+        cache_key = f"ratelimit:{self._token_hash}"
+        cached = storage.cache_get(cache_key)
+        if cached:
+            self._rl_snapshot = cached
+            self._rl_snapshot_at = time.monotonic()
+            return cached
+
+        def _fetch():
+            rate_limit = self._github.get_rate_limit()
+
+            return {
+                "core": {
+                    "limit": rate_limit.core.limit,
+                    "remaining": rate_limit.core.remaining,
+                    "reset": rate_limit.core.reset,
+                    "used": rate_limit.core.used
+                },
+                "search": {
+                    "limit": rate_limit.search.limit,
+                    "remaining": rate_limit.search.remaining,
+                    "reset": rate_limit.search.reset,
+                    "used": rate_limit.search.used
+                }
             }
-        }
+
+        self._rl_snapshot = await self._retry_with_backoff(_fetch)
+        self._rl_snapshot_at = time.monotonic()
+        storage.cache_set(cache_key, self._rl_snapshot, ttl_seconds=self.CACHE_TTL_RATE_LIMIT)
+
+        return self._rl_snapshot
@@ -13,20 +13,77 @@ Sessions are kept in-memory only (expire on restart).
 Note: This will be replaced with database storage (PostgreSQL + SQLAlchemy) in Phase 2.
 """
 
+import atexit
+import bisect
+import logging
+import heapq
 import threading
+import time
 import json
 import os
+import re
 import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import islice
 
 from src.models.auth import AuthSession, User, Token
 from src.models.github import Repository, Branch, Feature
 from src.models.documents import Document, Spec, Plan, Task, AnalysisResult
 from src.models.websocket import WebSocketSession, WebSocketMessage, Operation
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    def _json_dumpb(data: Any) -> bytes:
+        """Serialize one persistence entry compactly (orjson handles datetime/enum natively)."""
+        return orjson.dumps(data, default=str)
+
+    _json_loads = orjson.loads
+except ImportError:  # fall back to stdlib if orjson isn't installed
+    def _json_dumpb(data: Any) -> bytes:
+        return json.dumps(data, default=str, separators=(',', ':')).encode()
+
+    _json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # streaming parse is an optional optimization
+    ijson = None
+
+# Title/description extraction for local spec discovery, compiled once so the
+# per-file scan runs in the regex engine instead of a Python line loop
+_TITLE_RE = re.compile(r'^#\s+(.+?)\s*$', re.M)
+_FIRST_PARA_RE = re.compile(r'^#\s+.+\n(?:\s*\n)*(?!#)(\S[^\n]*)', re.M)
+
+# Above this size, persisted stores are stream-parsed entry-by-entry instead
+# of materializing the raw bytes and the full parsed tree at the same time
+_LARGE_FILE_STREAM_THRESHOLD = 1_000_000  # bytes
+
+
+@lru_cache(maxsize=4096)
+def _local_feature_id(name: str) -> str:
+    """Deterministic feature id for a local spec directory (memoized uuid5)."""
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, f"local-spec-{name}"))
+
+
+def _load_persisted_dict(path: Path) -> Dict[str, Any]:
+    """Parse a persisted ``{id: dict}`` JSON file.
+
+    Small files go through orjson, which wins on low per-call overhead.
+    Large files are stream-parsed with ijson (when installed) so peak
+    memory is one entry at a time rather than 2x the file size.
+    """
+    if ijson is not None and path.stat().st_size > _LARGE_FILE_STREAM_THRESHOLD:
+        with open(path, 'rb') as f:
+            return {key: value for key, value in ijson.kvitems(f, '')}
+    return _json_loads(path.read_bytes())
+
 
 class InMemoryStorage:
     """
@@ -42,15 +99,57 @@ class InMemoryStorage:
     - Operations: ./.data/operations.json
     """
     
+    # Fixed attribute set: blocks stray attribute creation on the singleton
+    # and makes every self._* access a C-level slot lookup instead of a
+    # __dict__ probe on hot paths
+    __slots__ = (
+        '_auth_lock', '_repos_lock', '_features_lock', '_documents_lock',
+        '_ws_lock', '_operations_lock', '_persist_lock',
+        '_sessions', '_users', '_tokens',
+        '_repositories', '_branches',
+        '_features', '_raw_features', '_raw_operations',
+        '_feature_bytes', '_operation_bytes',
+        '_documents', '_analysis_results',
+        '_ws_sessions', '_ws_messages', '_ws_sequences', '_total_ws_messages',
+        '_operations',
+        '_features_by_repo', '_features_by_user',
+        '_documents_by_feature', '_docs_by_feature_type', '_analyses_by_feature',
+        '_ops_by_feature', '_ops_by_connection',
+        '_cache_shards', '_cache_heaps', '_cache_locks',
+        '_features_dirty', '_operations_dirty',
+    )
+
     # Data directory for persistence
     DATA_DIR = Path("./.data")
     FEATURES_FILE = DATA_DIR / "features.json"
     OPERATIONS_FILE = DATA_DIR / "operations.json"
+
+    # How often the background thread flushes dirty collections to disk
+    FLUSH_INTERVAL_SECONDS = 0.5
+
+    # Number of independent cache shards (must be a power of two)
+    CACHE_SHARD_COUNT = 16
     
     def __init__(self):
         """Initialize storage with empty collections and load persisted data."""
-        # Locks for thread-safe operations
-        self._lock = threading.RLock()
+        # Per-collection locks so independent subsystems don't contend
+        # (e.g. a cache_get never blocks a save_feature). Cross-collection
+        # operations (clear, get_stats) acquire them in the canonical order
+        # auth -> repos -> features -> documents -> ws -> operations -> cache.
+        self._auth_lock = threading.RLock()       # _sessions, _users, _tokens
+        self._repos_lock = threading.RLock()      # _repositories, _branches
+        self._features_lock = threading.RLock()   # _features (+ dirty flag)
+        self._documents_lock = threading.RLock()  # _documents, _analysis_results
+        self._ws_lock = threading.RLock()         # _ws_sessions, _ws_messages
+        self._operations_lock = threading.RLock() # _operations (+ dirty flag)
+        # The cache is sharded (see below); each shard carries its own lock,
+        # acquired in shard order when a cross-shard operation needs them all.
+        # Serializes writers of the persisted JSON files: the flush thread,
+        # the atexit flush, and direct flush() callers would otherwise race
+        # on the fixed tmp path in _write_bytes_atomic and rename interleaved
+        # bytes over the real file. Held around snapshot + write so a later
+        # snapshot can never be overwritten by an earlier one.
+        self._persist_lock = threading.Lock()
         
         # Ensure data directory exists
         self.DATA_DIR.mkdir(exist_ok=True)
@@ -64,6 +163,16 @@ class InMemoryStorage:
         self._repositories: Dict[str, Repository] = {}  # full_name -> Repository
         self._branches: Dict[str, List[Branch]] = defaultdict(list)  # repo_full_name -> [Branch]
         self._features: Dict[str, Feature] = {}  # feature_id -> Feature
+        # Raw dicts loaded from disk but not yet validated into models.
+        # Startup only parses JSON; Pydantic validation (the expensive part)
+        # is deferred to first access and the instance cached in _features.
+        self._raw_features: Dict[str, dict] = {}  # feature_id -> unparsed dict
+        self._raw_operations: Dict[str, dict] = {}  # operation_id -> unparsed dict
+        # Serialized JSON bytes of every persisted entry, refreshed on save.
+        # Persistence concatenates these byte strings into the file body, so
+        # a flush never re-traverses or re-encodes an unchanged model.
+        self._feature_bytes: Dict[str, bytes] = {}  # feature_id -> serialized bytes
+        self._operation_bytes: Dict[str, bytes] = {}  # operation_id -> serialized bytes
         
         # Document storage
         self._documents: Dict[str, Document] = {}  # document_id -> Document
@@ -73,20 +182,60 @@ class InMemoryStorage:
         
         # WebSocket storage
         self._ws_sessions: Dict[str, WebSocketSession] = {}  # connection_id -> WebSocketSession
-        self._ws_messages: Dict[str, List[WebSocketMessage]] = defaultdict(list)  # operation_id -> [Message]
+        # Messages are append-only with monotonically increasing sequence, so
+        # a deque plus a parallel sequence list lets get_ws_messages serve
+        # from_sequence with a binary search instead of filter + sort.
+        self._ws_messages: Dict[str, deque] = defaultdict(deque)  # operation_id -> deque[Message]
+        self._ws_sequences: Dict[str, List[int]] = defaultdict(list)  # operation_id -> [sequence]
+        # Running total across all operations so get_stats is O(1)
+        self._total_ws_messages = 0
         self._operations: Dict[str, Operation] = {}  # operation_id -> Operation
         
-        # Caches with TTL
-        self._cache: Dict[str, Any] = {}  # cache_key -> cached_value
-        self._cache_expiry: Dict[str, datetime] = {}  # cache_key -> expiry_time
+        # Secondary indexes so the list_*/lookup methods are O(k) in the
+        # size of the filtered result instead of O(N) scans under a lock.
+        # Maintained by the save_*/delete_* methods below.
+        self._features_by_repo: Dict[str, Set[str]] = defaultdict(set)  # repo full_name -> feature_ids
+        self._features_by_user: Dict[int, Set[str]] = defaultdict(set)  # user_id -> feature_ids
+        self._documents_by_feature: Dict[str, Set[str]] = defaultdict(set)  # feature_id -> document_ids
+        self._docs_by_feature_type: Dict[Tuple[str, str], str] = {}  # (feature_id, doc type) -> document_id
+        self._analyses_by_feature: Dict[str, Set[str]] = defaultdict(set)  # feature_id -> analysis_ids
+        self._ops_by_feature: Dict[str, Set[str]] = defaultdict(set)  # feature_id -> operation_ids
+        self._ops_by_connection: Dict[str, Set[str]] = defaultdict(set)  # connection_id -> operation_ids
+
+        # Caches with TTL. Expiry is a time.monotonic() float (cheaper than
+        # a datetime allocation per lookup); per-shard heaps order entries by
+        # eviction time so _expire_cache() never scans a whole shard. Keys
+        # hash to one of CACHE_SHARD_COUNT independent (dict, heap, lock)
+        # triples so concurrent cache traffic on unrelated keys never
+        # contends on a single mutex.
+        self._cache_shards: List[Dict[str, Tuple[Any, float]]] = [
+            {} for _ in range(self.CACHE_SHARD_COUNT)
+        ]  # cache_key -> (value, expiry)
+        self._cache_heaps: List[List[Tuple[float, str]]] = [
+            [] for _ in range(self.CACHE_SHARD_COUNT)
+        ]  # (eviction_time, key)
+        self._cache_locks: List[threading.Lock] = [
+            threading.Lock() for _ in range(self.CACHE_SHARD_COUNT)
+        ]
         
         # Load persisted data from disk
         self._load_features_from_disk()
         self._load_operations_from_disk()
         
         # Discover features from local specs directory if storage is empty
-        if not self._features:
+        if not self._features and not self._raw_features:
             self._discover_features_from_local_specs()
+
+        # Debounced persistence: mutations mark a collection dirty and a
+        # background thread batches the full-file rewrites, instead of one
+        # O(N) serialization per save call
+        self._features_dirty = False
+        self._operations_dirty = False
+        flush_thread = threading.Thread(
+            target=self._flush_loop, daemon=True, name="storage-flush"
+        )
+        flush_thread.start()
+        atexit.register(self.flush)
     
     # ========================================================================
     # Authentication Operations
@@ -94,14 +243,14 @@ class InMemoryStorage:
     
     def save_session(self, session: AuthSession) -> None:
         """Save or update an authentication session."""
-        with self._lock:
+        with self._auth_lock:
             self._sessions[session.session_id] = session
             self._users[session.user.id] = session.user
             self._tokens[session.token.token_id] = session.token
     
     def get_session(self, session_id: str) -> Optional[AuthSession]:
         """Get session by ID."""
-        with self._lock:
+        with self._auth_lock:
             session = self._sessions.get(session_id)
             if session and not session.is_expired and session.is_active:
                 session.refresh_access()
@@ -110,16 +259,13 @@ class InMemoryStorage:
     
     def delete_session(self, session_id: str) -> bool:
         """Delete a session."""
-        with self._lock:
-            if session_id in self._sessions:
-                session = self._sessions.pop(session_id)
-                # Don't delete user/token as they may be used by other sessions
-                return True
-            return False
+        with self._auth_lock:
+            # Don't delete user/token as they may be used by other sessions
+            return self._sessions.pop(session_id, None) is not None
     
     def get_user_sessions(self, user_id: int) -> List[AuthSession]:
         """Get all active sessions for a user."""
-        with self._lock:
+        with self._auth_lock:
             return [
                 session for session in self._sessions.values()
                 if session.user.id == user_id and not session.is_expired and session.is_active
@@ -127,7 +273,7 @@ class InMemoryStorage:
     
     def cleanup_expired_sessions(self) -> int:
         """Remove expired sessions. Returns number of sessions cleaned."""
-        with self._lock:
+        with self._auth_lock:
             expired_ids = [
                 sid for sid, session in self._sessions.items()
                 if session.is_expired or not session.is_active
@@ -142,60 +288,121 @@ class InMemoryStorage:
     
     def save_repository(self, repository: Repository) -> None:
         """Save or update a repository."""
-        with self._lock:
+        with self._repos_lock:
             self._repositories[repository.full_name] = repository
     
     def get_repository(self, full_name: str) -> Optional[Repository]:
         """Get repository by full name."""
-        with self._lock:
+        with self._repos_lock:
             return self._repositories.get(full_name)
     
     def list_repositories(self, user_id: int) -> List[Repository]:
         """List all repositories (filtered by user if needed)."""
-        with self._lock:
+        with self._repos_lock:
             # In Phase 1, return all repos (no user filtering)
             return list(self._repositories.values())
     
     def save_branches(self, repo_full_name: str, branches: List[Branch]) -> None:
         """Save branches for a repository."""
-        with self._lock:
+        with self._repos_lock:
             self._branches[repo_full_name] = branches
     
     def get_branches(self, repo_full_name: str) -> List[Branch]:
         """Get branches for a repository."""
-        with self._lock:
+        with self._repos_lock:
             return self._branches.get(repo_full_name, [])
     
+    def _index_feature(self, feature: Feature) -> None:
+        """Add a feature to the secondary indexes (caller holds the lock)."""
+        self._features_by_repo[feature.repository_full_name].add(feature.feature_id)
+        self._features_by_user[feature.created_by_user_id].add(feature.feature_id)
+
+    def _unindex_feature(self, feature: Feature) -> None:
+        """Remove a feature from the secondary indexes (caller holds the lock)."""
+        self._features_by_repo[feature.repository_full_name].discard(feature.feature_id)
+        self._features_by_user[feature.created_by_user_id].discard(feature.feature_id)
+
+    def _materialize_feature(self, feature_id: str) -> Optional[Feature]:
+        """Validate a lazily-loaded raw feature into a model (caller holds the lock)."""
+        raw = self._raw_features.pop(feature_id, None)
+        if raw is None:
+            return None
+        try:
+            feature = Feature(**raw)
+        except Exception as e:
+            logger.warning(f"Failed to load feature {feature_id}: {e}")
+            self._features_by_repo[raw.get('repository_full_name')].discard(feature_id)
+            self._features_by_user[raw.get('created_by_user_id')].discard(feature_id)
+            return None
+        self._features[feature_id] = feature
+        # Serialize the raw dict once; it is already this feature's JSON form
+        self._feature_bytes[feature_id] = _json_dumpb(raw)
+        return feature
+
     def save_feature(self, feature: Feature) -> None:
         """Save or update a feature."""
-        with self._lock:
+        with self._features_lock:
+            raw = self._raw_features.pop(feature.feature_id, None)
+            if raw is not None:
+                self._features_by_repo[raw.get('repository_full_name')].discard(feature.feature_id)
+                self._features_by_user[raw.get('created_by_user_id')].discard(feature.feature_id)
+            existing = self._features.get(feature.feature_id)
+            if existing is not None:
+                self._unindex_feature(existing)
             self._features[feature.feature_id] = feature
-            self._persist_features_to_disk()
-    
+            self._index_feature(feature)
+            self._feature_bytes[feature.feature_id] = _json_dumpb(feature.dict())
+            self._features_dirty = True
+
     def get_feature(self, feature_id: str) -> Optional[Feature]:
         """Get feature by ID."""
-        with self._lock:
-            return self._features.get(feature_id)
-    
+        with self._features_lock:
+            feature = self._features.get(feature_id)
+            if feature is None:
+                feature = self._materialize_feature(feature_id)
+            return feature
+
     def list_features(self, repository_full_name: Optional[str] = None, user_id: Optional[int] = None) -> List[Feature]:
-        """List features with optional filtering."""
-        with self._lock:
-            features = list(self._features.values())
-            
-            if repository_full_name:
-                features = [f for f in features if f.repository_full_name == repository_full_name]
-            
-            if user_id:
-                features = [f for f in features if f.created_by_user_id == user_id]
-            
+        """List features with optional filtering (index lookups, no full scan)."""
+        with self._features_lock:
+            if repository_full_name and user_id:
+                ids = (
+                    self._features_by_repo.get(repository_full_name, set())
+                    & self._features_by_user.get(user_id, set())
+                )
+            elif repository_full_name:
+                ids = self._features_by_repo.get(repository_full_name, set())
+            elif user_id:
+                ids = self._features_by_user.get(user_id, set())
+            else:
+                for feature_id in list(self._raw_features):
+                    self._materialize_feature(feature_id)
+                return list(self._features.values())
+
+            features = []
+            for fid in list(ids):
+                feature = self._features.get(fid)
+                if feature is None:
+                    feature = self._materialize_feature(fid)
+                if feature is not None:
+                    features.append(feature)
             return features
-    
+
     def delete_feature(self, feature_id: str) -> bool:
         """Delete a feature."""
-        with self._lock:
-            if feature_id in self._features:
-                del self._features[feature_id]
-                self._persist_features_to_disk()
+        with self._features_lock:
+            feature = self._features.pop(feature_id, None)
+            if feature is not None:
+                self._unindex_feature(feature)
+                self._feature_bytes.pop(feature_id, None)
+                self._features_dirty = True
+                return True
+            raw = self._raw_features.pop(feature_id, None)
+            if raw is not None:
+                self._feature_bytes.pop(feature_id, None)
+                self._features_by_repo[raw.get('repository_full_name')].discard(feature_id)
+                self._features_by_user[raw.get('created_by_user_id')].discard(feature_id)
+                self._features_dirty = True
                 return True
             return False
     
@@ -203,51 +410,77 @@ class InMemoryStorage:
     # Document Operations
     # ========================================================================
     
+    @staticmethod
+    def _doc_type_key(document_type: Any) -> str:
+        """Normalize a DocumentType enum or plain string for index keys."""
+        return document_type.value if hasattr(document_type, "value") else document_type
+
     def save_document(self, document: Document) -> None:
         """Save or update a document."""
-        with self._lock:
+        with self._documents_lock:
+            existing = self._documents.get(document.document_id)
+            if existing is not None:
+                self._documents_by_feature[existing.feature_id].discard(existing.document_id)
+                self._docs_by_feature_type.pop(
+                    (existing.feature_id, self._doc_type_key(existing.document_type)), None
+                )
             self._documents[document.document_id] = document
-    
+            self._documents_by_feature[document.feature_id].add(document.document_id)
+            self._docs_by_feature_type[
+                (document.feature_id, self._doc_type_key(document.document_type))
+            ] = document.document_id
+
     def get_document(self, document_id: str) -> Optional[Document]:
         """Get document by ID."""
-        with self._lock:
+        with self._documents_lock:
             return self._documents.get(document_id)
-    
+
     def get_document_by_feature_and_type(self, feature_id: str, document_type: str) -> Optional[Document]:
-        """Get document by feature ID and type."""
-        with self._lock:
-            for doc in self._documents.values():
-                if doc.feature_id == feature_id and doc.document_type == document_type:
-                    return doc
-            return None
-    
+        """Get document by feature ID and type (O(1) index lookup)."""
+        with self._documents_lock:
+            document_id = self._docs_by_feature_type.get(
+                (feature_id, self._doc_type_key(document_type))
+            )
+            return self._documents.get(document_id) if document_id else None
+
     def list_documents(self, feature_id: str) -> List[Document]:
         """List all documents for a feature."""
-        with self._lock:
-            return [doc for doc in self._documents.values() if doc.feature_id == feature_id]
-    
+        with self._documents_lock:
+            return [
+                self._documents[doc_id]
+                for doc_id in self._documents_by_feature.get(feature_id, set())
+            ]
+
     def delete_document(self, document_id: str) -> bool:
         """Delete a document."""
-        with self._lock:
-            if document_id in self._documents:
-                del self._documents[document_id]
+        with self._documents_lock:
+            document = self._documents.pop(document_id, None)
+            if document is not None:
+                self._documents_by_feature[document.feature_id].discard(document_id)
+                self._docs_by_feature_type.pop(
+                    (document.feature_id, self._doc_type_key(document.document_type)), None
+                )
                 return True
             return False
-    
+
     def save_analysis_result(self, result: AnalysisResult) -> None:
         """Save analysis result."""
-        with self._lock:
+        with self._documents_lock:
             self._analysis_results[result.analysis_id] = result
-    
+            self._analyses_by_feature[result.feature_id].add(result.analysis_id)
+
     def get_analysis_result(self, analysis_id: str) -> Optional[AnalysisResult]:
         """Get analysis result by ID."""
-        with self._lock:
+        with self._documents_lock:
             return self._analysis_results.get(analysis_id)
-    
+
     def list_analysis_results(self, feature_id: str) -> List[AnalysisResult]:
         """List all analysis results for a feature."""
-        with self._lock:
-            return [r for r in self._analysis_results.values() if r.feature_id == feature_id]
+        with self._documents_lock:
+            return [
+                self._analysis_results[aid]
+                for aid in self._analyses_by_feature.get(feature_id, set())
+            ]
     
     # ========================================================================
     # WebSocket Operations
@@ -255,25 +488,22 @@ class InMemoryStorage:
     
     def save_ws_session(self, ws_session: WebSocketSession) -> None:
         """Save or update WebSocket session."""
-        with self._lock:
+        with self._ws_lock:
             self._ws_sessions[ws_session.connection_id] = ws_session
     
     def get_ws_session(self, connection_id: str) -> Optional[WebSocketSession]:
         """Get WebSocket session by connection ID."""
-        with self._lock:
+        with self._ws_lock:
             return self._ws_sessions.get(connection_id)
     
     def delete_ws_session(self, connection_id: str) -> bool:
         """Delete WebSocket session."""
-        with self._lock:
-            if connection_id in self._ws_sessions:
-                del self._ws_sessions[connection_id]
-                return True
-            return False
+        with self._ws_lock:
+            return self._ws_sessions.pop(connection_id, None) is not None
     
     def list_ws_sessions(self, user_id: Optional[int] = None) -> List[WebSocketSession]:
         """List WebSocket sessions, optionally filtered by user."""
-        with self._lock:
+        with self._ws_lock:
             sessions = list(self._ws_sessions.values())
             if user_id:
                 sessions = [s for s in sessions if s.user_id == user_id]
@@ -281,151 +511,322 @@ class InMemoryStorage:
     
     def add_ws_message(self, message: WebSocketMessage) -> None:
         """Add a WebSocket message to the history."""
-        with self._lock:
+        with self._ws_lock:
+            sequences = self._ws_sequences[message.operation_id]
+            # INVARIANT: messages are appended in sequence order.
+            # get_ws_messages relies on this to skip sorting and to
+            # binary-search from_sequence resumes (compiled out with -O).
+            assert not sequences or message.sequence >= sequences[-1], (
+                f"out-of-order WebSocket message for {message.operation_id}: "
+                f"{message.sequence} after {sequences[-1]}"
+            )
             self._ws_messages[message.operation_id].append(message)
-    
+            sequences.append(message.sequence)
+            self._total_ws_messages += 1
+
     def get_ws_messages(self, operation_id: str, from_sequence: Optional[int] = None) -> List[WebSocketMessage]:
-        """Get WebSocket messages for an operation."""
-        with self._lock:
-            messages = self._ws_messages.get(operation_id, [])
-            if from_sequence is not None:
-                messages = [m for m in messages if m.sequence >= from_sequence]
-            return sorted(messages, key=lambda m: m.sequence)
-    
+        """Get WebSocket messages for an operation (already in sequence order)."""
+        with self._ws_lock:
+            messages = self._ws_messages.get(operation_id)
+            if not messages:
+                return []
+            if from_sequence is None:
+                return list(messages)
+            # Binary-search the parallel sequence list for the slice start
+            start = bisect.bisect_left(self._ws_sequences[operation_id], from_sequence)
+            return list(islice(messages, start, None))
+
     def cleanup_old_ws_messages(self, retention_minutes: int = 10) -> int:
         """Remove WebSocket messages older than retention period. Returns count removed."""
-        with self._lock:
-            cutoff_time = datetime.utcnow() - timedelta(minutes=retention_minutes)
+        with self._ws_lock:
+            # Compute the cutoff once, outside the loop; comparing float
+            # epochs is far cheaper than datetime objects per message
+            cutoff_ts = time.time() - retention_minutes * 60
             removed_count = 0
-            
-            for operation_id in list(self._ws_messages.keys()):
-                original_count = len(self._ws_messages[operation_id])
-                self._ws_messages[operation_id] = [
-                    m for m in self._ws_messages[operation_id]
-                    if m.timestamp > cutoff_time
-                ]
-                removed_count += original_count - len(self._ws_messages[operation_id])
-                
-                # Remove empty operation message lists
-                if not self._ws_messages[operation_id]:
+
+            for operation_id, messages in list(self._ws_messages.items()):
+                # Timestamps are append-ordered, so expired messages sit at
+                # the front: pop until the head is fresh, O(removed) not O(N)
+                removed = 0
+                while messages and messages[0].timestamp_ts <= cutoff_ts:
+                    messages.popleft()
+                    removed += 1
+                if removed:
+                    del self._ws_sequences[operation_id][:removed]
+                    removed_count += removed
+                    self._total_ws_messages -= removed
+
+                if not messages:
+                    # Remove empty operation message lists
                     del self._ws_messages[operation_id]
-            
+                    self._ws_sequences.pop(operation_id, None)
+
             return removed_count
     
+    def _index_operation(self, operation: Operation) -> None:
+        """Add an operation to the secondary indexes (caller holds the lock)."""
+        if operation.feature_id:
+            self._ops_by_feature[operation.feature_id].add(operation.operation_id)
+        if operation.connection_id:
+            self._ops_by_connection[operation.connection_id].add(operation.operation_id)
+
+    def _unindex_operation(self, operation: Operation) -> None:
+        """Remove an operation from the secondary indexes (caller holds the lock)."""
+        if operation.feature_id:
+            self._ops_by_feature[operation.feature_id].discard(operation.operation_id)
+        if operation.connection_id:
+            self._ops_by_connection[operation.connection_id].discard(operation.operation_id)
+
+    def _materialize_operation(self, operation_id: str) -> Optional[Operation]:
+        """Validate a lazily-loaded raw operation into a model (caller holds the lock)."""
+        raw = self._raw_operations.pop(operation_id, None)
+        if raw is None:
+            return None
+        try:
+            operation = Operation(**raw)
+        except Exception as e:
+            logger.warning(f"Failed to load operation {operation_id}: {e}")
+            if raw.get('feature_id'):
+                self._ops_by_feature[raw['feature_id']].discard(operation_id)
+            if raw.get('connection_id'):
+                self._ops_by_connection[raw['connection_id']].discard(operation_id)
+            return None
+        self._operations[operation_id] = operation
+        # Serialize the raw dict once; it is already this operation's JSON form
+        self._operation_bytes[operation_id] = _json_dumpb(raw)
+        return operation
+
     def save_operation(self, operation: Operation) -> None:
         """Save or update an operation."""
-        with self._lock:
+        with self._operations_lock:
+            raw = self._raw_operations.pop(operation.operation_id, None)
+            if raw is not None:
+                if raw.get('feature_id'):
+                    self._ops_by_feature[raw['feature_id']].discard(operation.operation_id)
+                if raw.get('connection_id'):
+                    self._ops_by_connection[raw['connection_id']].discard(operation.operation_id)
+            existing = self._operations.get(operation.operation_id)
+            if existing is not None:
+                self._unindex_operation(existing)
             self._operations[operation.operation_id] = operation
-            self._persist_operations_to_disk()
-    
+            self._index_operation(operation)
+            self._operation_bytes[operation.operation_id] = _json_dumpb(operation.dict())
+            self._operations_dirty = True
+
     def get_operation(self, operation_id: str) -> Optional[Operation]:
         """Get operation by ID."""
-        with self._lock:
-            return self._operations.get(operation_id)
-    
+        with self._operations_lock:
+            operation = self._operations.get(operation_id)
+            if operation is None:
+                operation = self._materialize_operation(operation_id)
+            return operation
+
     def list_operations(self, feature_id: Optional[str] = None, connection_id: Optional[str] = None) -> List[Operation]:
-        """List operations with optional filtering."""
-        with self._lock:
-            operations = list(self._operations.values())
-            
-            if feature_id:
-                operations = [op for op in operations if op.feature_id == feature_id]
-            
-            if connection_id:
-                operations = [op for op in operations if op.connection_id == connection_id]
-            
+        """List operations with optional filtering (index lookups, no full scan)."""
+        with self._operations_lock:
+            if feature_id and connection_id:
+                ids = (
+                    self._ops_by_feature.get(feature_id, set())
+                    & self._ops_by_connection.get(connection_id, set())
+                )
+            elif feature_id:
+                ids = self._ops_by_feature.get(feature_id, set())
+            elif connection_id:
+                ids = self._ops_by_connection.get(connection_id, set())
+            else:
+                for operation_id in list(self._raw_operations):
+                    self._materialize_operation(operation_id)
+                return list(self._operations.values())
+
+            operations = []
+            for oid in list(ids):
+                operation = self._operations.get(oid)
+                if operation is None:
+                    operation = self._materialize_operation(oid)
+                if operation is not None:
+                    operations.append(operation)
             return operations
+
+    def delete_operation(self, operation_id: str) -> bool:
+        """Delete an operation."""
+        with self._operations_lock:
+            operation = self._operations.pop(operation_id, None)
+            if operation is not None:
+                self._unindex_operation(operation)
+                self._operation_bytes.pop(operation_id, None)
+                self._operations_dirty = True
+                return True
+            raw = self._raw_operations.pop(operation_id, None)
+            if raw is not None:
+                self._operation_bytes.pop(operation_id, None)
+                if raw.get('feature_id'):
+                    self._ops_by_feature[raw['feature_id']].discard(operation_id)
+                if raw.get('connection_id'):
+                    self._ops_by_connection[raw['connection_id']].discard(operation_id)
+                self._operations_dirty = True
+                return True
+            return False
     
     # ========================================================================
     # Cache Operations
     # ========================================================================
     
+    # How long expired entries are kept for cache_get_stale fallback
+    CACHE_STALE_RETENTION_SECONDS = 86400  # 24 hours
+
+    def _cache_shard(self, key: str) -> Tuple[Dict[str, Tuple[Any, float]], List[Tuple[float, str]], threading.Lock]:
+        """Return the (dict, heap, lock) triple a key hashes to."""
+        index = hash(key) & (self.CACHE_SHARD_COUNT - 1)
+        return self._cache_shards[index], self._cache_heaps[index], self._cache_locks[index]
+
+    def _expire_cache(self, shard: Dict[str, Tuple[Any, float]], heap: List[Tuple[float, str]], now: float) -> None:
+        """Evict shard entries past the staleness horizon (caller holds the shard lock).
+
+        Pops the expiry heap instead of scanning the whole shard, so the
+        cost is O(log N) per evicted entry. Heap entries for keys that were
+        overwritten or explicitly deleted are skipped when popped.
+        """
+        while heap and heap[0][0] <= now:
+            eviction_time, key = heapq.heappop(heap)
+            entry = shard.get(key)
+            if entry is not None and entry[1] + self.CACHE_STALE_RETENTION_SECONDS == eviction_time:
+                del shard[key]
+
     def cache_set(self, key: str, value: Any, ttl_seconds: int = 300) -> None:
         """Set a cached value with TTL."""
-        with self._lock:
-            self._cache[key] = value
-            self._cache_expiry[key] = datetime.utcnow() + timedelta(seconds=ttl_seconds)
-    
+        shard, heap, lock = self._cache_shard(key)
+        with lock:
+            now = time.monotonic()
+            self._expire_cache(shard, heap, now)
+            expiry = now + ttl_seconds
+            shard[key] = (value, expiry)
+            heapq.heappush(heap, (expiry + self.CACHE_STALE_RETENTION_SECONDS, key))
+
     def cache_get(self, key: str) -> Optional[Any]:
         """Get a cached value if not expired."""
-        with self._lock:
-            if key in self._cache:
-                if datetime.utcnow() < self._cache_expiry[key]:
-                    return self._cache[key]
-                else:
-                    # Expired, remove
-                    del self._cache[key]
-                    del self._cache_expiry[key]
+        shard, _, lock = self._cache_shard(key)
+        with lock:
+            entry = shard.get(key)
+            if entry is not None and time.monotonic() < entry[1]:
+                return entry[0]
             return None
-    
+
+    def cache_get_stale(self, key: str) -> Optional[Any]:
+        """Get a cached value even if expired, within the staleness horizon.
+
+        Fallback for when the upstream source is unreachable
+        (stale-while-error): a recently-expired entry beats no data.
+        """
+        shard, _, lock = self._cache_shard(key)
+        with lock:
+            entry = shard.get(key)
+            if entry is not None and time.monotonic() < entry[1] + self.CACHE_STALE_RETENTION_SECONDS:
+                return entry[0]
+            return None
+
     def cache_invalidate(self, pattern: Optional[str] = None) -> int:
         """Invalidate cache entries matching pattern. Returns count invalidated."""
-        with self._lock:
-            if pattern is None:
-                # Clear all
-                count = len(self._cache)
-                self._cache.clear()
-                self._cache_expiry.clear()
-                return count
-            else:
-                # Clear matching pattern
-                keys_to_delete = [k for k in self._cache.keys() if pattern in k]
-                for key in keys_to_delete:
-                    del self._cache[key]
-                    if key in self._cache_expiry:
-                        del self._cache_expiry[key]
-                return len(keys_to_delete)
+        count = 0
+        for index in range(self.CACHE_SHARD_COUNT):
+            with self._cache_locks[index]:
+                shard = self._cache_shards[index]
+                if pattern is None:
+                    # Clear the shard (stale heap entries are skipped on pop)
+                    count += len(shard)
+                    shard.clear()
+                    self._cache_heaps[index].clear()
+                else:
+                    # Clear matching pattern
+                    keys_to_delete = [k for k in shard.keys() if pattern in k]
+                    for key in keys_to_delete:
+                        del shard[key]
+                    count += len(keys_to_delete)
+        return count
     
     # ========================================================================
     # Persistence Operations (File-based for durability across restarts)
     # ========================================================================
-    
+
+    def _flush_loop(self) -> None:
+        """Background loop that writes dirty collections to disk."""
+        while True:
+            time.sleep(self.FLUSH_INTERVAL_SECONDS)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.exception(f"Error in background flush: {e}")
+
+    def flush(self) -> None:
+        """Write any dirty collections to disk immediately.
+
+        Called periodically by the flush thread, at interpreter exit, and
+        by tests that need persistence to be synchronous.
+
+        Only the payload snapshot happens under the collection lock (a
+        shallow merge of pre-serialized dicts); serialization and the file
+        write run outside it so saves are never blocked on disk I/O.
+        Writers themselves are serialized by _persist_lock so concurrent
+        flushes cannot race on the shared tmp file.
+        """
+        with self._persist_lock:
+            features_payload = None
+            with self._features_lock:
+                if self._features_dirty:
+                    features_payload = self._serialized_entries(self._raw_features, self._feature_bytes)
+                    self._features_dirty = False
+            if features_payload is not None:
+                try:
+                    self._write_bytes_atomic(self.FEATURES_FILE, self._assemble_json_object(features_payload))
+                except Exception as e:
+                    logger.exception(f"Error persisting features to disk: {e}")
+
+            operations_payload = None
+            with self._operations_lock:
+                if self._operations_dirty:
+                    operations_payload = self._serialized_entries(self._raw_operations, self._operation_bytes)
+                    self._operations_dirty = False
+            if operations_payload is not None:
+                try:
+                    self._write_bytes_atomic(self.OPERATIONS_FILE, self._assemble_json_object(operations_payload))
+                except Exception as e:
+                    logger.exception(f"Error persisting operations to disk: {e}")
+
     def _load_features_from_disk(self) -> None:
-        """Load features from persistent JSON storage."""
+        """Load features from persistent JSON storage.
+
+        Only the JSON parse happens here; model validation is deferred to
+        first access (see _materialize_feature), so startup cost is a single
+        file read regardless of how many features are stored.
+        """
         try:
             if self.FEATURES_FILE.exists():
-                with open(self.FEATURES_FILE, 'r') as f:
-                    data = json.load(f)
-                    for feature_id, feature_dict in data.items():
-                        try:
-                            # Convert string datetime fields to datetime objects if needed
-                            if 'created_at' in feature_dict and isinstance(feature_dict['created_at'], str):
-                                feature_dict['created_at'] = feature_dict['created_at']
-                            if 'updated_at' in feature_dict and isinstance(feature_dict['updated_at'], str):
-                                feature_dict['updated_at'] = feature_dict['updated_at']
-                            
-                            feature = Feature(**feature_dict)
-                            self._features[feature_id] = feature
-                            print(f"[Storage] Loaded feature: {feature_id} | repo: {feature.repository_full_name} | branch: {feature.branch_name}")
-                        except Exception as e:
-                            print(f"[Storage ERROR] Failed to load feature {feature_id}: {e}")
-                            import traceback
-                            traceback.print_exc()
-                    print(f"[Storage] Successfully loaded {len(self._features)} features from disk")
+                self._raw_features = _load_persisted_dict(self.FEATURES_FILE)
+                for feature_id, feature_dict in self._raw_features.items():
+                    # Index from the raw dict so filtered list_features works
+                    # without materializing every feature
+                    self._features_by_repo[feature_dict.get('repository_full_name')].add(feature_id)
+                    self._features_by_user[feature_dict.get('created_by_user_id')].add(feature_id)
+                logger.info(f"Loaded {len(self._raw_features)} features from disk (lazy)")
             else:
-                print("[Storage] No features file found - starting with empty features")
+                logger.info("No features file found - starting with empty features")
         except Exception as e:
-            print(f"[Storage ERROR] Error loading features from disk: {e}")
-            import traceback
-            traceback.print_exc()
-    
+            logger.exception(f"Error loading features from disk: {e}")
+
     def _load_operations_from_disk(self) -> None:
-        """Load operations from persistent JSON storage."""
+        """Load operations from persistent JSON storage (validation deferred)."""
         try:
             if self.OPERATIONS_FILE.exists():
-                with open(self.OPERATIONS_FILE, 'r') as f:
-                    data = json.load(f)
-                    for operation_id, operation_dict in data.items():
-                        try:
-                            operation = Operation(**operation_dict)
-                            self._operations[operation_id] = operation
-                        except Exception as e:
-                            print(f"Warning: Failed to load operation {operation_id}: {e}")
-                    print(f"[Storage] Loaded {len(self._operations)} operations from disk")
+                self._raw_operations = _load_persisted_dict(self.OPERATIONS_FILE)
+                for operation_id, operation_dict in self._raw_operations.items():
+                    if operation_dict.get('feature_id'):
+                        self._ops_by_feature[operation_dict['feature_id']].add(operation_id)
+                    if operation_dict.get('connection_id'):
+                        self._ops_by_connection[operation_dict['connection_id']].add(operation_id)
+                logger.info(f"Loaded {len(self._raw_operations)} operations from disk (lazy)")
             else:
-                print("[Storage] No operations file found - starting with empty operations")
+                logger.info("No operations file found - starting with empty operations")
         except Exception as e:
-            print(f"[Storage] Error loading operations from disk: {e}")
+            logger.exception(f"Error loading operations from disk: {e}")
     
     def _discover_features_from_local_specs(self) -> None:
         """Discover features from local specs directory without requiring GitHub API."""
@@ -440,62 +841,53 @@ class InMemoryStorage:
                     break
             
             if not specs_dir:
-                print("[Storage] No specs directory found for local feature discovery")
+                logger.debug("No specs directory found for local feature discovery")
                 return
             
-            print(f"[Storage] Discovering features from local specs directory: {specs_dir}")
+            logger.info(f"Discovering features from local specs directory: {specs_dir}")
             discovered_count = 0
-            
-            # Scan all subdirectories in specs/
-            for spec_path in specs_dir.iterdir():
-                if not spec_path.is_dir():
-                    continue
-                
-                spec_file = spec_path / "spec.md"
-                if not spec_file.exists():
-                    continue
-                
+
+            # Scan all subdirectories in specs/ (scandir caches the dirent
+            # type, so this is one syscall per entry instead of stat per check)
+            with os.scandir(specs_dir) as it:
+                entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+
+            for entry in entries:
+                name = entry.name
                 try:
-                    # Read spec.md to extract title and description
-                    with open(spec_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        lines = content.split('\n')
-                        title = spec_path.name
-                        description = ""
-                        
-                        # Try to extract title from first header
-                        for line in lines:
-                            if line.startswith('# '):
-                                title = line[2:].strip()
-                                break
-                        
-                        # Try to extract description (first non-empty paragraph after title)
-                        found_title = False
-                        for line in lines:
-                            if line.startswith('# '):
-                                found_title = True
-                                continue
-                            if found_title and line.strip() and not line.startswith('#'):
-                                description = line.strip()
-                                break
-                    
-                    # Check for plan.md and tasks.md
+                    try:
+                        f = open(os.path.join(entry.path, "spec.md"), 'r', encoding='utf-8')
+                    except FileNotFoundError:
+                        continue
+
+                    # Title and description always sit near the top, so read
+                    # only the first 4 KB and extract with compiled regexes
+                    with f:
+                        head = f.read(4096)
+                    title_match = _TITLE_RE.search(head)
+                    title = title_match.group(1) if title_match else name
+                    para_match = _FIRST_PARA_RE.search(head)
+                    description = para_match.group(1).strip() if para_match else ""
+
+                    # Check for plan.md and tasks.md with a single directory scan
                     plan_path = None
                     task_path = None
-                    if (spec_path / "plan.md").exists():
-                        plan_path = f"specs/{spec_path.name}/plan.md"
-                    if (spec_path / "tasks.md").exists():
-                        task_path = f"specs/{spec_path.name}/tasks.md"
-                    
+                    with os.scandir(entry.path) as sibling_it:
+                        for sibling in sibling_it:
+                            if sibling.name == "plan.md":
+                                plan_path = f"specs/{name}/plan.md"
+                            elif sibling.name == "tasks.md":
+                                task_path = f"specs/{name}/tasks.md"
+
                     # Generate deterministic feature_id from spec path
-                    feature_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"local-spec-{spec_path.name}"))
-                    
+                    feature_id = _local_feature_id(name)
+
                     # Create Feature object
                     feature = Feature(
                         feature_id=feature_id,
                         repository_full_name="local/specs",
                         branch_name="main",
-                        spec_path=f"specs/{spec_path.name}/spec.md",
+                        spec_path=f"specs/{name}/spec.md",
                         plan_path=plan_path,
                         task_path=task_path,
                         title=title,
@@ -504,49 +896,78 @@ class InMemoryStorage:
                         updated_at=datetime.now(),
                         created_by_user_id=0
                     )
-                    
+
                     self._features[feature_id] = feature
+                    self._index_feature(feature)
+                    self._feature_bytes[feature_id] = _json_dumpb(feature.dict())
                     discovered_count += 1
-                    print(f"[Storage] Discovered feature: {title} ({spec_path.name})")
-                    
+                    logger.debug(f"Discovered feature: {title} ({name})")
+
                 except Exception as e:
-                    print(f"[Storage] Error discovering feature from {spec_path}: {e}")
+                    logger.warning(f"Error discovering feature from {entry.path}: {e}")
             
             if discovered_count > 0:
-                print(f"[Storage] Discovered {discovered_count} features from local specs")
+                logger.info(f"Discovered {discovered_count} features from local specs")
                 # Persist discovered features to disk
                 self._persist_features_to_disk()
             else:
-                print("[Storage] No features discovered from local specs")
+                logger.debug("No features discovered from local specs")
         
         except Exception as e:
-            print(f"[Storage] Error during local feature discovery: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Error during local feature discovery: {e}")
     
-    def _persist_features_to_disk(self) -> None:
+    @staticmethod
+    def _write_bytes_atomic(target: Path, blob: bytes, durable: bool = False) -> None:
+        """Write bytes to a temp file and rename it over the target.
+
+        A crash mid-write leaves the old file intact instead of a
+        truncated one (rename is atomic on POSIX). fsync is skipped on
+        the hot path; pass durable=True to force it before the rename.
+        """
+        tmp = target.with_suffix('.json.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(blob)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, target)
+
+    @staticmethod
+    def _serialized_entries(raw: Dict[str, dict], serialized: Dict[str, bytes]) -> List[Tuple[str, bytes]]:
+        """Snapshot a collection as (id, bytes) pairs (caller holds the lock).
+
+        Raw on-disk entries that were never touched get serialized once here
+        and the result cached, so later flushes are pure byte reuse.
+        """
+        for entry_id, entry_dict in raw.items():
+            if entry_id not in serialized:
+                serialized[entry_id] = _json_dumpb(entry_dict)
+        return list(serialized.items())
+
+    @staticmethod
+    def _assemble_json_object(entries: List[Tuple[str, bytes]]) -> bytes:
+        """Concatenate pre-serialized (id, bytes) pairs into one JSON object."""
+        return b'{' + b','.join(
+            _json_dumpb(entry_id) + b':' + payload for entry_id, payload in entries
+        ) + b'}'
+
+    def _persist_features_to_disk(self, durable: bool = False) -> None:
         """Persist all features to JSON file."""
         try:
-            with open(self.FEATURES_FILE, 'w') as f:
-                data = {
-                    feature_id: feature.dict() 
-                    for feature_id, feature in self._features.items()
-                }
-                json.dump(data, f, indent=2, default=str)
+            with self._persist_lock:
+                entries = self._serialized_entries(self._raw_features, self._feature_bytes)
+                self._write_bytes_atomic(self.FEATURES_FILE, self._assemble_json_object(entries), durable=durable)
         except Exception as e:
-            print(f"[Storage] Error persisting features to disk: {e}")
-    
-    def _persist_operations_to_disk(self) -> None:
+            logger.exception(f"Error persisting features to disk: {e}")
+
+    def _persist_operations_to_disk(self, durable: bool = False) -> None:
         """Persist all operations to JSON file."""
         try:
-            with open(self.OPERATIONS_FILE, 'w') as f:
-                data = {
-                    operation_id: operation.dict() 
-                    for operation_id, operation in self._operations.items()
-                }
-                json.dump(data, f, indent=2, default=str)
+            with self._persist_lock:
+                entries = self._serialized_entries(self._raw_operations, self._operation_bytes)
+                self._write_bytes_atomic(self.OPERATIONS_FILE, self._assemble_json_object(entries), durable=durable)
         except Exception as e:
-            print(f"[Storage] Error persisting operations to disk: {e}")
+            logger.exception(f"Error persisting operations to disk: {e}")
     
     # ========================================================================
     # Utility Operations
@@ -554,35 +975,57 @@ class InMemoryStorage:
     
     def clear(self) -> None:
         """Clear all storage (for testing)."""
-        with self._lock:
+        # Canonical lock order (see __init__) to avoid deadlock
+        with self._auth_lock, self._repos_lock, self._features_lock, \
+                self._documents_lock, self._ws_lock, self._operations_lock:
             self._sessions.clear()
             self._users.clear()
             self._tokens.clear()
             self._repositories.clear()
             self._branches.clear()
             self._features.clear()
+            self._raw_features.clear()
+            self._raw_operations.clear()
+            self._feature_bytes.clear()
+            self._operation_bytes.clear()
             self._documents.clear()
             self._analysis_results.clear()
             self._ws_sessions.clear()
             self._ws_messages.clear()
+            self._ws_sequences.clear()
+            self._total_ws_messages = 0
             self._operations.clear()
-            self._cache.clear()
-            self._cache_expiry.clear()
-    
+            self._features_by_repo.clear()
+            self._features_by_user.clear()
+            self._documents_by_feature.clear()
+            self._docs_by_feature_type.clear()
+            self._analyses_by_feature.clear()
+            self._ops_by_feature.clear()
+            self._ops_by_connection.clear()
+            # Don't let a pending flush persist the now-empty collections
+            self._features_dirty = False
+            self._operations_dirty = False
+        self.cache_invalidate()
+
     def get_stats(self) -> Dict[str, int]:
         """Get storage statistics."""
-        with self._lock:
+        # Cache shards are counted without their locks: per-shard len() is a
+        # single atomic read and the total is advisory anyway
+        cached_items = sum(len(shard) for shard in self._cache_shards)
+        # Canonical lock order (see __init__) to avoid deadlock
+        with self._auth_lock, self._repos_lock, self._features_lock, \
+                self._documents_lock, self._ws_lock, self._operations_lock:
             return {
                 "sessions": len(self._sessions),
                 "users": len(self._users),
                 "repositories": len(self._repositories),
-                "features": len(self._features),
+                "features": len(self._features) + len(self._raw_features),
                 "documents": len(self._documents),
                 "analysis_results": len(self._analysis_results),
                 "ws_sessions": len(self._ws_sessions),
-                "operations": len(self._operations),
-                "cached_items": len(self._cache),
-                "total_ws_messages": sum(len(msgs) for msgs in self._ws_messages.values())
+                "operations": len(self._operations) + len(self._raw_operations),
+                "cached_items": cached_items,
+                "total_ws_messages": self._total_ws_messages
             }
 
 
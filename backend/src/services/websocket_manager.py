@@ -12,9 +12,11 @@ Handles:
 import asyncio
 import logging
 from typing import Dict, List, Optional, Set
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict
 
+import orjson
+
 from fastapi import WebSocket, WebSocketDisconnect
 
 from src.models.websocket import (
@@ -25,10 +27,20 @@ from src.models.websocket import (
     MessagePriority
 )
 from src.services.storage import storage
+from src.utils.env_config import settings
 
 logger = logging.getLogger(__name__)
 
 
+def _serialize_message(message: WebSocketMessage) -> str:
+    """Serialize a message to its wire form once, for reuse across subscribers.
+
+    Returns a str so delivery uses text frames - the web client parses
+    event.data directly and does not handle binary frames.
+    """
+    return orjson.dumps(message.model_dump(mode="json")).decode()
+
+
 class ConnectionManager:
     """
     Manages WebSocket connections and message delivery.
@@ -43,22 +55,40 @@ class ConnectionManager:
     
     # Message history retention (10 minutes)
     MESSAGE_RETENTION_MINUTES = 10
+
+    # Writer-loop coalescing caps: when a burst backs up in a connection's
+    # queue, merge up to this many messages/chars into one array frame
+    BATCH_MAX_MESSAGES = 64
+    BATCH_MAX_BYTES = 64 * 1024
     
     def __init__(self):
         """Initialize connection manager."""
         # Active WebSocket connections: connection_id -> WebSocket
         self._connections: Dict[str, WebSocket] = {}
         
-        # Operation subscriptions: operation_id -> Set[connection_id]
+        # Operation subscriptions: operation_id -> Set[connection_id],
+        # plus the inverse (connection_id -> operation_ids) so a session's
+        # active operations live in memory and sync to storage lazily
         self._operation_subscriptions: Dict[str, Set[str]] = defaultdict(set)
+        self._connection_operations: Dict[str, Set[str]] = defaultdict(set)
         
         # Connection to session mapping: connection_id -> session_id
         self._connection_sessions: Dict[str, str] = {}
-        
-        # Message queues per operation: operation_id -> List[WebSocketMessage]
-        # (This is redundant with storage, but provides fast access)
-        self._message_queues: Dict[str, List[WebSocketMessage]] = defaultdict(list)
-        
+
+        # Reverse index for user broadcasts: user_id -> Set[connection_id]
+        # (and back), so broadcast_to_user never scans storage sessions
+        self._user_connections: Dict[int, Set[str]] = defaultdict(set)
+        self._connection_users: Dict[str, int] = {}
+        
+        # Outbound delivery: a bounded queue plus one long-lived writer task
+        # per connection. Publishers only enqueue — a slow client never
+        # stalls a broadcast, and there is no per-message task churn.
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._writers: Dict[str, asyncio.Task] = {}
+
+        # Settings value hoisted once - pydantic attribute access is not free
+        self._queue_maxsize = settings.websocket_message_queue_size
+
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
     
@@ -90,7 +120,13 @@ class ConnectionManager:
         async with self._lock:
             self._connections[connection_id] = websocket
             self._connection_sessions[connection_id] = session_id
-        
+            self._user_connections[user_id].add(connection_id)
+            self._connection_users[connection_id] = user_id
+            self._queues[connection_id] = asyncio.Queue(maxsize=self._queue_maxsize)
+            self._writers[connection_id] = asyncio.create_task(
+                self._writer_loop(connection_id, websocket)
+            )
+
         # Create WebSocket session
         ws_session = WebSocketSession(
             connection_id=connection_id,
@@ -109,30 +145,94 @@ class ConnectionManager:
         
         return ws_session
     
+    async def _writer_loop(self, connection_id: str, websocket: WebSocket):
+        """
+        Drain a connection's outbound queue onto its socket.
+
+        Runs as one long-lived task per connection so message delivery is a
+        tight receive/send loop with natural backpressure from the bounded
+        queue, instead of a fresh task per message per subscriber.
+        """
+        queue = self._queues[connection_id]
+        try:
+            while True:
+                payload = await queue.get()
+
+                # Coalesce any backlog into a single array frame so a
+                # burst costs one frame and one socket write instead of
+                # one per message. Clients distinguish the batch by the
+                # array (vs object) envelope.
+                batch = [payload]
+                total_bytes = len(payload)
+                while (
+                    len(batch) < self.BATCH_MAX_MESSAGES
+                    and total_bytes < self.BATCH_MAX_BYTES
+                ):
+                    try:
+                        extra = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    batch.append(extra)
+                    total_bytes += len(extra)
+
+                if len(batch) == 1:
+                    await websocket.send_text(payload)
+                else:
+                    # Payloads are already serialized JSON objects, so
+                    # the array frame is a plain string join
+                    await websocket.send_text("[" + ",".join(batch) + "]")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to send message to {connection_id}: {e}")
+            await self.disconnect(connection_id)
+
     async def disconnect(self, connection_id: str):
         """
         Disconnect and cleanup WebSocket connection.
-        
+
         Args:
             connection_id: Connection ID to disconnect
         """
+        # Stop the writer first (unless we're being called from it)
+        writer = self._writers.pop(connection_id, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
         async with self._lock:
             # Remove from connections
             websocket = self._connections.pop(connection_id, None)
             session_id = self._connection_sessions.pop(connection_id, None)
+            self._queues.pop(connection_id, None)
+
+            # Drop from the user reverse index
+            user_id = self._connection_users.pop(connection_id, None)
+            if user_id is not None:
+                user_conns = self._user_connections.get(user_id)
+                if user_conns is not None:
+                    user_conns.discard(connection_id)
+                    if not user_conns:
+                        del self._user_connections[user_id]
             
-            # Remove from all operation subscriptions
-            for operation_id in list(self._operation_subscriptions.keys()):
-                self._operation_subscriptions[operation_id].discard(connection_id)
-                
+            # Remove only the operations this connection subscribed to -
+            # O(own subscriptions), not O(all live operations)
+            active_operations = self._connection_operations.pop(connection_id, set())
+            for operation_id in active_operations:
+                subscribers = self._operation_subscriptions.get(operation_id)
+                if subscribers is None:
+                    continue
+                subscribers.discard(connection_id)
+
                 # Clean up empty subscription sets
-                if not self._operation_subscriptions[operation_id]:
+                if not subscribers:
                     del self._operation_subscriptions[operation_id]
-        
-        # Update session in storage
+
+        # Update session in storage, including the lazily-synced
+        # final set of active operations
         ws_session = storage.get_ws_session(connection_id)
         if ws_session:
             ws_session.is_connected = False
+            ws_session.active_operations = list(active_operations)
             storage.save_ws_session(ws_session)
         
         logger.info(f"WebSocket disconnected: {connection_id}")
@@ -145,16 +245,12 @@ class ConnectionManager:
             connection_id: Connection ID
             operation_id: Operation ID to subscribe to
         """
-        async with self._lock:
-            self._operation_subscriptions[operation_id].add(connection_id)
-        
-        # Update session
-        ws_session = storage.get_ws_session(connection_id)
-        if ws_session:
-            if operation_id not in ws_session.active_operations:
-                ws_session.active_operations.append(operation_id)
-                storage.save_ws_session(ws_session)
-        
+        # Await-free set mutations - atomic on the event loop. The
+        # session's active_operations are tracked here and written back
+        # to storage once, on disconnect, instead of per subscribe.
+        self._operation_subscriptions[operation_id].add(connection_id)
+        self._connection_operations[connection_id].add(operation_id)
+
         logger.debug(f"Connection {connection_id} subscribed to operation {operation_id}")
     
     async def unsubscribe_from_operation(self, connection_id: str, operation_id: str):
@@ -165,20 +261,19 @@ class ConnectionManager:
             connection_id: Connection ID
             operation_id: Operation ID to unsubscribe from
         """
-        async with self._lock:
-            if operation_id in self._operation_subscriptions:
-                self._operation_subscriptions[operation_id].discard(connection_id)
-                
-                if not self._operation_subscriptions[operation_id]:
-                    del self._operation_subscriptions[operation_id]
-        
-        # Update session
-        ws_session = storage.get_ws_session(connection_id)
-        if ws_session:
-            if operation_id in ws_session.active_operations:
-                ws_session.active_operations.remove(operation_id)
-                storage.save_ws_session(ws_session)
-        
+        # Await-free mutations - no lock needed on the event loop
+        if operation_id in self._operation_subscriptions:
+            self._operation_subscriptions[operation_id].discard(connection_id)
+
+            if not self._operation_subscriptions[operation_id]:
+                del self._operation_subscriptions[operation_id]
+
+        if connection_id in self._connection_operations:
+            self._connection_operations[connection_id].discard(operation_id)
+
+            if not self._connection_operations[connection_id]:
+                del self._connection_operations[connection_id]
+
         logger.debug(f"Connection {connection_id} unsubscribed from operation {operation_id}")
     
     # ========================================================================
@@ -187,22 +282,45 @@ class ConnectionManager:
     
     async def send_message(self, connection_id: str, message: WebSocketMessage):
         """
-        Send message to a specific connection.
-        
+        Enqueue a message for a specific connection.
+
+        The connection's writer task performs the actual socket send;
+        this only enqueues, so callers never block on a slow client.
+
         Args:
             connection_id: Target connection ID
             message: Message to send
         """
-        async with self._lock:
-            websocket = self._connections.get(connection_id)
-        
-        if websocket:
-            try:
-                await websocket.send_json(message.model_dump(mode="json"))
-                logger.debug(f"Sent message {message.message_id} to {connection_id}")
-            except Exception as e:
-                logger.error(f"Failed to send message to {connection_id}: {e}")
-                await self.disconnect(connection_id)
+        await self._send_payload(connection_id, _serialize_message(message))
+
+    def _enqueue(self, connection_id: str, payload: str) -> bool:
+        """
+        Enqueue a pre-serialized payload for a connection's writer task.
+
+        Returns False only when the connection exists but its queue is
+        full, i.e. the client is too slow and should be dropped.
+        """
+        # Single dict read on the event-loop thread - no lock needed
+        queue = self._queues.get(connection_id)
+
+        if queue is None:
+            return True
+
+        try:
+            queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def _drop_slow_client(self, connection_id: str):
+        """Disconnect a client whose outbound queue hit its backpressure limit."""
+        logger.warning(f"Outbound queue full for {connection_id}; disconnecting slow client")
+        await self.disconnect(connection_id)
+
+    async def _send_payload(self, connection_id: str, payload: str):
+        """Enqueue a payload for one connection, dropping it if its queue is full."""
+        if not self._enqueue(connection_id, payload):
+            await self._drop_slow_client(connection_id)
     
     async def broadcast_to_operation(self, operation_id: str, message: WebSocketMessage):
         """
@@ -212,26 +330,25 @@ class ConnectionManager:
             operation_id: Operation ID
             message: Message to broadcast
         """
-        # Add to message queue
-        async with self._lock:
-            self._message_queues[operation_id].append(message)
-        
-        # Store in persistent storage
+        # Store in persistent storage (also serves replay - no separate
+        # in-memory mirror to keep in sync)
         storage.add_ws_message(message)
-        
-        # Get subscribed connections
-        async with self._lock:
-            subscriber_ids = list(self._operation_subscriptions.get(operation_id, set()))
-        
-        # Send to all subscribers
-        send_tasks = []
-        for connection_id in subscriber_ids:
-            send_tasks.append(self.send_message(connection_id, message))
-        
-        if send_tasks:
-            await asyncio.gather(*send_tasks, return_exceptions=True)
-        
-        logger.debug(f"Broadcasted message {message.message_id} to {len(subscriber_ids)} connections")
+
+        # Serialize once and enqueue the same string for every subscriber;
+        # the per-connection writer tasks handle the sends. Iterate the
+        # subscription set directly - _enqueue never awaits, so nothing
+        # can mutate the set mid-iteration and no O(K) copy is needed.
+        payload = _serialize_message(message)
+        subscribers = self._operation_subscriptions.get(operation_id, ())
+        subscriber_count = len(subscribers)
+        overflowed = [cid for cid in subscribers if not self._enqueue(cid, payload)]
+
+        # Disconnects mutate the subscription set, so slow clients are
+        # dropped only after iteration completes
+        for connection_id in overflowed:
+            await self._drop_slow_client(connection_id)
+
+        logger.debug(f"Broadcasted message {message.message_id} to {subscriber_count} connections")
     
     async def broadcast_to_user(self, user_id: int, message: WebSocketMessage):
         """
@@ -241,19 +358,18 @@ class ConnectionManager:
             user_id: User ID
             message: Message to broadcast
         """
-        # Get all user sessions
-        sessions = storage.list_ws_sessions(user_id=user_id)
-        
-        # Send to all connected sessions
-        send_tasks = []
-        for ws_session in sessions:
-            if ws_session.is_connected:
-                send_tasks.append(self.send_message(ws_session.connection_id, message))
-        
-        if send_tasks:
-            await asyncio.gather(*send_tasks, return_exceptions=True)
-        
-        logger.debug(f"Broadcasted message to {len(send_tasks)} connections for user {user_id}")
+        # Serialize once and enqueue straight from the reverse index -
+        # no storage scan, no list copy, no tasks or gather. _enqueue
+        # never awaits, so the set cannot change mid-iteration.
+        payload = _serialize_message(message)
+        connections = self._user_connections.get(user_id, ())
+        connection_count = len(connections)
+        overflowed = [cid for cid in connections if not self._enqueue(cid, payload)]
+
+        for connection_id in overflowed:
+            await self._drop_slow_client(connection_id)
+
+        logger.debug(f"Broadcasted message to {connection_count} connections for user {user_id}")
     
     # ========================================================================
     # Message Replay (for reconnection)
@@ -278,10 +394,14 @@ class ConnectionManager:
         """
         # Get messages from storage
         messages = storage.get_ws_messages(operation_id, from_sequence=from_sequence + 1)
-        
-        # Send messages in sequence
+
+        # Enqueue every frame up front instead of one sequential await
+        # per message; the writer loop's coalescing then delivers the
+        # backlog as a few array frames rather than N individual sends
         for message in messages:
-            await self.send_message(connection_id, message)
+            if not self._enqueue(connection_id, _serialize_message(message)):
+                await self._drop_slow_client(connection_id)
+                break
         
         logger.info(f"Replayed {len(messages)} messages to {connection_id} for operation {operation_id}")
         
@@ -298,26 +418,12 @@ class ConnectionManager:
         Returns:
             Number of messages removed
         """
-        # Clean up from storage
+        # Storage holds the only copy of message history, so cleaning it
+        # up is the whole job
         removed_count = storage.cleanup_old_ws_messages(
             retention_minutes=self.MESSAGE_RETENTION_MINUTES
         )
-        
-        # Clean up in-memory queues
-        cutoff_time = datetime.utcnow() - timedelta(minutes=self.MESSAGE_RETENTION_MINUTES)
-        
-        async with self._lock:
-            for operation_id in list(self._message_queues.keys()):
-                original_count = len(self._message_queues[operation_id])
-                self._message_queues[operation_id] = [
-                    msg for msg in self._message_queues[operation_id]
-                    if msg.timestamp > cutoff_time
-                ]
-                
-                # Remove empty queues
-                if not self._message_queues[operation_id]:
-                    del self._message_queues[operation_id]
-        
+
         if removed_count > 0:
             logger.info(f"Cleaned up {removed_count} old messages")
         
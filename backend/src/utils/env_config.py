@@ -3,8 +3,8 @@ Environment configuration management for backend application.
 Loads and validates configuration from environment variables.
 """
 
-from functools import lru_cache
-from typing import List
+from functools import cached_property, lru_cache
+from typing import FrozenSet, List
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -64,11 +64,16 @@ class Settings(BaseSettings):
         extra="ignore"
     )
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from comma-separated string."""
+        """Parse CORS origins from comma-separated string (split once, cached)."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
+    @cached_property
+    def cors_origins_set(self) -> FrozenSet[str]:
+        """CORS origins as a frozenset for O(1) per-request membership checks."""
+        return frozenset(self.cors_origins_list)
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
@@ -9,12 +9,12 @@ Provides:
 """
 
 import logging
+import time
 import traceback
 from typing import Optional, Any, Dict
-from datetime import datetime
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -24,6 +24,28 @@ from src.services.copilot_runner import SubprocessError, SubprocessTimeoutError,
 
 logger = logging.getLogger(__name__)
 
+# Invariant parts of the common HTTP_{code} error bodies, built once per
+# status code so the hot handler only fills in message and timestamp
+_HTTP_ERROR_TEMPLATES: Dict[int, Dict[str, Any]] = {}
+
+# Dispatch tables keyed on exact exception type - one dict lookup instead
+# of an isinstance cascade on the error hot path. A None message means
+# "use str(exc)".
+_AUTH_ERROR_MAP = {
+    InvalidTokenError: ("INVALID_TOKEN", "GitHub token is invalid or revoked"),
+    SessionExpiredError: ("SESSION_EXPIRED", "Session has expired"),
+}
+
+_GITHUB_ERROR_MAP = {
+    GitHubAuthenticationError: ("GITHUB_AUTH_ERROR", status.HTTP_401_UNAUTHORIZED),
+    GitHubRateLimitError: ("GITHUB_RATE_LIMIT", status.HTTP_429_TOO_MANY_REQUESTS),
+}
+
+_SUBPROCESS_ERROR_MAP = {
+    SubprocessTimeoutError: ("SUBPROCESS_TIMEOUT", "Operation timed out"),
+    SubprocessExecutionError: ("SUBPROCESS_EXECUTION_ERROR", None),
+}
+
 
 class ErrorResponse:
     """
@@ -55,7 +77,7 @@ class ErrorResponse:
             "error": {
                 "code": error_code,
                 "message": message,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": time.time(),
                 "status": status_code
             }
         }
@@ -70,7 +92,7 @@ class ErrorResponse:
 # Exception Handlers
 # ========================================================================
 
-async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> ORJSONResponse:
     """
     Handle HTTP exceptions.
     
@@ -90,19 +112,20 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
         }
     )
     
-    error_response = ErrorResponse.format(
-        error_code=f"HTTP_{exc.status_code}",
-        message=exc.detail,
-        status_code=exc.status_code
-    )
-    
-    return JSONResponse(
+    base = _HTTP_ERROR_TEMPLATES.get(exc.status_code)
+    if base is None:
+        base = _HTTP_ERROR_TEMPLATES[exc.status_code] = {
+            "code": f"HTTP_{exc.status_code}",
+            "status": exc.status_code
+        }
+
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=error_response
+        content={"error": {**base, "message": exc.detail, "timestamp": time.time()}}
     )
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """
     Handle request validation errors.
     
@@ -128,13 +151,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=error_response
     )
 
 
-async def authentication_exception_handler(request: Request, exc: AuthenticationError) -> JSONResponse:
+async def authentication_exception_handler(request: Request, exc: AuthenticationError) -> ORJSONResponse:
     """
     Handle authentication errors.
     
@@ -154,14 +177,8 @@ async def authentication_exception_handler(request: Request, exc: Authentication
     )
     
     # Determine specific error code
-    if isinstance(exc, InvalidTokenError):
-        error_code = "INVALID_TOKEN"
-        message = "GitHub token is invalid or revoked"
-    elif isinstance(exc, SessionExpiredError):
-        error_code = "SESSION_EXPIRED"
-        message = "Session has expired"
-    else:
-        error_code = "AUTHENTICATION_FAILED"
+    error_code, message = _AUTH_ERROR_MAP.get(type(exc), ("AUTHENTICATION_FAILED", None))
+    if message is None:
         message = str(exc)
     
     error_response = ErrorResponse.format(
@@ -170,13 +187,13 @@ async def authentication_exception_handler(request: Request, exc: Authentication
         status_code=status.HTTP_401_UNAUTHORIZED
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_401_UNAUTHORIZED,
         content=error_response
     )
 
 
-async def github_api_exception_handler(request: Request, exc: GitHubAPIError) -> JSONResponse:
+async def github_api_exception_handler(request: Request, exc: GitHubAPIError) -> ORJSONResponse:
     """
     Handle GitHub API errors.
     
@@ -196,15 +213,9 @@ async def github_api_exception_handler(request: Request, exc: GitHubAPIError) ->
     )
     
     # Determine specific error code and status
-    if isinstance(exc, GitHubAuthenticationError):
-        error_code = "GITHUB_AUTH_ERROR"
-        status_code = status.HTTP_401_UNAUTHORIZED
-    elif isinstance(exc, GitHubRateLimitError):
-        error_code = "GITHUB_RATE_LIMIT"
-        status_code = status.HTTP_429_TOO_MANY_REQUESTS
-    else:
-        error_code = "GITHUB_API_ERROR"
-        status_code = status.HTTP_502_BAD_GATEWAY
+    error_code, status_code = _GITHUB_ERROR_MAP.get(
+        type(exc), ("GITHUB_API_ERROR", status.HTTP_502_BAD_GATEWAY)
+    )
     
     error_response = ErrorResponse.format(
         error_code=error_code,
@@ -212,13 +223,13 @@ async def github_api_exception_handler(request: Request, exc: GitHubAPIError) ->
         status_code=status_code
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content=error_response
     )
 
 
-async def subprocess_exception_handler(request: Request, exc: SubprocessError) -> JSONResponse:
+async def subprocess_exception_handler(request: Request, exc: SubprocessError) -> ORJSONResponse:
     """
     Handle subprocess errors.
     
@@ -238,14 +249,8 @@ async def subprocess_exception_handler(request: Request, exc: SubprocessError) -
     )
     
     # Determine specific error code
-    if isinstance(exc, SubprocessTimeoutError):
-        error_code = "SUBPROCESS_TIMEOUT"
-        message = "Operation timed out"
-    elif isinstance(exc, SubprocessExecutionError):
-        error_code = "SUBPROCESS_EXECUTION_ERROR"
-        message = str(exc)
-    else:
-        error_code = "SUBPROCESS_ERROR"
+    error_code, message = _SUBPROCESS_ERROR_MAP.get(type(exc), ("SUBPROCESS_ERROR", None))
+    if message is None:
         message = str(exc)
     
     error_response = ErrorResponse.format(
@@ -254,13 +259,13 @@ async def subprocess_exception_handler(request: Request, exc: SubprocessError) -
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=error_response
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """
     Handle unexpected errors.
     
@@ -271,13 +276,15 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     Returns:
         JSON error response
     """
-    # Log full traceback for debugging
+    # Attach the exception lazily via exc_info - the stdlib only formats
+    # the traceback if a handler actually emits the record, so error
+    # storms don't pay for stack formatting that nothing consumes
     logger.error(
         f"Unexpected error: {str(exc)}",
+        exc_info=exc,
         extra={
             "path": request.url.path,
-            "method": request.method,
-            "traceback": traceback.format_exc()
+            "method": request.method
         }
     )
     
@@ -288,7 +295,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=error_response
     )
@@ -341,7 +348,7 @@ def create_error_response(
     message: str,
     status_code: int,
     details: Optional[Dict[str, Any]] = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create error JSON response.
     
@@ -361,7 +368,7 @@ def create_error_response(
         status_code=status_code
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content=error_response
     )
@@ -381,12 +388,17 @@ def log_error_with_context(
         level: Log level (error, warning, critical)
     """
     log_method = getattr(logger, level)
-    
+
+    extra = {
+        **context,
+        "error_type": type(error).__name__
+    }
+
+    # Only build the traceback string when DEBUG output would show it
+    if logger.isEnabledFor(logging.DEBUG):
+        extra["traceback"] = traceback.format_exc()
+
     log_method(
         f"{type(error).__name__}: {str(error)}",
-        extra={
-            **context,
-            "error_type": type(error).__name__,
-            "traceback": traceback.format_exc()
-        }
+        extra=extra
     )
@@ -138,29 +138,43 @@ class WebSocketService {
 
   /**
    * Handle incoming WebSocket message.
+   *
+   * The server coalesces bursts into a single array frame, so a frame
+   * is either one message object or an array of them.
    */
   private handleMessage(event: MessageEvent): void {
     try {
-      const message: WebSocketMessage = JSON.parse(event.data);
+      const parsed: WebSocketMessage | WebSocketMessage[] = JSON.parse(event.data);
 
-      // Store connection ID from first message
-      if (message.type === MessageType.CONNECTION && message.data?.connection_id) {
-        this.connectionId = message.data.connection_id;
-        console.log('WebSocket connection ID:', this.connectionId);
+      if (Array.isArray(parsed)) {
+        parsed.forEach(message => this.processMessage(message));
+      } else {
+        this.processMessage(parsed);
       }
+    } catch (error) {
+      console.error('Error handling WebSocket message:', error);
+    }
+  }
 
-      // Update last sequence for operation
-      this.lastSequences.set(message.operation_id, message.sequence);
+  /**
+   * Process a single decoded message.
+   */
+  private processMessage(message: WebSocketMessage): void {
+    // Store connection ID from first message
+    if (message.type === MessageType.CONNECTION && message.data?.connection_id) {
+      this.connectionId = message.data.connection_id;
+      console.log('WebSocket connection ID:', this.connectionId);
+    }
 
-      // Route message to handlers
-      this.routeMessage(message);
+    // Update last sequence for operation
+    this.lastSequences.set(message.operation_id, message.sequence);
 
-      // Send acknowledgment for important messages
-      if (message.priority === 'high' || message.priority === 'critical') {
-        this.sendAcknowledgment(message.operation_id, message.sequence);
-      }
-    } catch (error) {
-      console.error('Error handling WebSocket message:', error);
+    // Route message to handlers
+    this.routeMessage(message);
+
+    // Send acknowledgment for important messages
+    if (message.priority === 'high' || message.priority === 'critical') {
+      this.sendAcknowledgment(message.operation_id, message.sequence);
     }
   }
 
@@ -20,7 +20,7 @@ trap shutdown SIGINT SIGTERM
 
 echo "Starting backend on ${BACKEND_HOST}:${BACKEND_PORT}..."
 cd /app/backend
-python -m uvicorn src.main:app --host "$BACKEND_HOST" --port "$BACKEND_PORT" &
+python -m uvicorn src.main:app --host "$BACKEND_HOST" --port "$BACKEND_PORT" --ws-per-message-deflate false &
 BACKEND_PID=$!
 
 echo "Starting frontend on 0.0.0.0:${FRONTEND_PORT}..."
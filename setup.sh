@@ -337,7 +337,7 @@ main() {
     echo "     source backend/venv/bin/activate"
     echo ""
     echo "  2. Start the backend server:"
-    echo "     cd backend && python -m uvicorn src.main:app --reload --port 8001"
+    echo "     cd backend && python -m uvicorn src.main:app --reload --port 8001 --ws-per-message-deflate false"
     echo ""
     echo "  3. In a new terminal, start the frontend:"
     echo "     cd frontend && npm run dev"